@@ -621,19 +621,21 @@ class CorsikaConfig:
         str
             Piece of text to be added to the CORSIKA input file.
         """
-        corsika_input_list = ""
+        corsika_input_list = []
         for telescope_name, telescope in self.array_model.telescope_model.items():
-            positions = telescope.get_parameter_value_with_unit("array_element_position_ground")
-            corsika_input_list += "TELESCOPE"
-            for pos in positions:
-                corsika_input_list += f"\t {pos.to('cm').value:.3f}"
+            pos_x, pos_y, pos_z = (
+                pos.to("cm").value
+                for pos in telescope.get_parameter_value_with_unit("array_element_position_ground")
+            )
             sphere_radius = telescope.get_parameter_value_with_unit("telescope_sphere_radius").to(
                 "cm"
             )
-            corsika_input_list += f"\t {sphere_radius:.3f}"
-            corsika_input_list += f"\t # {telescope_name}\n"
+            corsika_input_list.append(
+                f"TELESCOPE\t {pos_x:.3f}\t {pos_y:.3f}\t {pos_z:.3f}"
+                f"\t {sphere_radius:.3f}\t # {telescope_name}\n"
+            )
 
-        return corsika_input_list
+        return "".join(corsika_input_list)
 
     @property
     def run_number(self):
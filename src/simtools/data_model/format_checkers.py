@@ -9,6 +9,8 @@ from simtools.utils import names
 
 format_checker = jsonschema.FormatChecker()
 
+_ARRAY_TRIGGERS_NAME_PATTERN = re.compile(r"(.*)(?=_single_telescope|_array)")
+
 
 @format_checker.checks("astropy_unit")
 def check_astropy_unit(unit_string):
@@ -45,8 +47,11 @@ def check_array_element(element):
 @format_checker.checks("array_triggers_name")
 def check_array_triggers_name(name):
     """Validate array trigger names for jsonschema."""
-    pattern = r"(.*)(?=_single_telescope|_array)"
-    if not re.match(pattern, name):
-        raise ValueError(f"Array trigger name '{name}' does not match pattern '{pattern}'")
-    names.validate_array_element_type(re.match(pattern, name).group(1))
+    match = _ARRAY_TRIGGERS_NAME_PATTERN.match(name)
+    if not match:
+        raise ValueError(
+            f"Array trigger name '{name}' does not match pattern "
+            f"'{_ARRAY_TRIGGERS_NAME_PATTERN.pattern}'"
+        )
+    names.validate_array_element_type(match.group(1))
     return True
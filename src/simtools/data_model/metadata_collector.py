@@ -83,7 +83,7 @@ class MetadataCollector:
                 fill_method = getattr(self, f"_fill_{meta_type}_meta")
                 fill_method(self.top_level_meta[self.observatory][meta_type])
             except AttributeError:
-                self._logger.debug(f"Method _fill_{meta_type}_meta not implemented")
+                self._logger.debug("Method _fill_%s_meta not implemented", meta_type)
 
     def get_top_level_metadata(self):
         """
@@ -268,10 +268,7 @@ class MetadataCollector:
 
         schema.validate_dict_using_schema(_input_metadata, None)
 
-        return gen.change_dict_keys_case(
-            self._process_metadata_from_file(_input_metadata),
-            lower_case=True,
-        )
+        return self._process_metadata_from_file(_input_metadata)
 
     def _read_input_metadata_from_ecsv(self, metadata_file_name):
         """Read input metadata from ecsv file."""
@@ -504,6 +501,10 @@ class MetadataCollector:
         str
             with line feeds removed
         """
+        if not isinstance(string, str) or (
+            "\n" not in string and "\r" not in string and "  " not in string
+        ):
+            return string
         return string.replace("\n", " ").replace("\r", "").replace("  ", " ")
 
     def _copy_list_type_metadata(self, context_dict, _input_metadata, key):
@@ -1,6 +1,8 @@
 """Module providing functionality to read and validate dictionaries using schema."""
 
+import copy
 import logging
+from functools import cache, lru_cache
 from pathlib import Path
 
 import jsonschema
@@ -78,7 +80,7 @@ def get_model_parameter_schema_version(schema_version=None):
         Schema version.
 
     """
-    schemas = gen.collect_data_from_file(MODEL_PARAMETER_METASCHEMA)
+    schemas = read_schema_file(MODEL_PARAMETER_METASCHEMA)
 
     if schema_version is None and schemas:
         return schemas[0].get("version")
@@ -110,20 +112,73 @@ def validate_dict_using_schema(data, schema_file=None, json_schema=None):
         _logger.warning(f"No schema provided for validation of {data}")
         return
     if json_schema is None:
-        json_schema = load_schema(
-            schema_file,
+        validator = _get_schema_validator_for_file(
+            str(schema_file),
             data.get("schema_version", "0.1.0"),  # default version to ensure backward compatibility
         )
+        json_schema = validator.schema
+    else:
+        validator = _get_schema_validator(json_schema)
 
-    try:
-        jsonschema.validate(data, schema=json_schema, format_checker=format_checkers.format_checker)
-    except jsonschema.exceptions.ValidationError as exc:
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
         _logger.error(f"Validation failed using schema: {json_schema}")
-        raise exc
+        raise error
     if data.get("meta_schema_url") and not gen.url_exists(data["meta_schema_url"]):
         raise FileNotFoundError(f"Meta schema URL does not exist: {data['meta_schema_url']}")
 
-    _logger.debug(f"Successful validation of data using schema ({json_schema.get('name')})")
+    _logger.debug("Successful validation of data using schema (%s)", json_schema.get("name"))
+
+
+def _get_schema_validator(json_schema):
+    """
+    Check schema and return validator for it.
+
+    Equivalent to the schema check and validator creation of jsonschema.validate.
+
+    Parameters
+    ----------
+    json_schema: dict
+        Schema used for validation.
+
+    Returns
+    -------
+    jsonschema.protocols.Validator
+        Validator for the given schema.
+
+    Raises
+    ------
+    jsonschema.exceptions.SchemaError
+        if the schema is invalid
+
+    """
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema, format_checker=format_checkers.format_checker)
+
+
+@lru_cache(maxsize=32)
+def _get_schema_validator_for_file(schema_file, schema_version):
+    """
+    Return validator for a schema file and schema version.
+
+    Schemas are read, checked and validators are created only once for each schema
+    file and version (schema files do not change during run time).
+
+    Parameters
+    ----------
+    schema_file: str
+        Path to schema file.
+    schema_version: str
+        Schema version.
+
+    Returns
+    -------
+    jsonschema.protocols.Validator
+        Validator for the given schema.
+
+    """
+    return _get_schema_validator(load_schema(schema_file, schema_version))
 
 
 def load_schema(schema_file=None, schema_version=None):
@@ -152,7 +207,7 @@ def load_schema(schema_file=None, schema_version=None):
 
     for path in (schema_file, SCHEMA_PATH / schema_file):
         try:
-            schema = gen.collect_data_from_file(file_name=path)
+            schema = read_schema_file(path)
             break
         except FileNotFoundError:
             continue
@@ -174,6 +229,35 @@ def load_schema(schema_file=None, schema_version=None):
     return schema
 
 
+def read_schema_file(file_name):
+    """
+    Read schema from file.
+
+    Schema files distributed with simtools (in SCHEMA_PATH) do not change during
+    run time and are read only once; a copy of the cached schema is returned.
+
+    Parameters
+    ----------
+    file_name: str or Path
+        Path to schema file.
+
+    Returns
+    -------
+    dict or list
+        Schema dictionary (or list of schema dictionaries).
+
+    """
+    if str(file_name).startswith(str(SCHEMA_PATH)):
+        return copy.deepcopy(_read_simtools_schema_file(str(file_name)))
+    return gen.collect_data_from_file(file_name=file_name)
+
+
+@cache
+def _read_simtools_schema_file(file_name):
+    """Read schema file distributed with simtools and keep in cache."""
+    return gen.collect_data_from_file(file_name=file_name)
+
+
 def _add_array_elements(key, schema):
     """
     Add list of array elements to schema.
@@ -196,7 +280,9 @@ def _add_array_elements(key, schema):
     """
     _list_of_array_elements = sorted(names.array_elements().keys())
 
-    def recursive_search(sub_schema, key):
+    sub_schemas = [schema]
+    while sub_schemas:
+        sub_schema = sub_schemas.pop()
         if key in sub_schema:
             if "enum" in sub_schema[key] and isinstance(sub_schema[key]["enum"], list):
                 sub_schema[key]["enum"] = list(
@@ -205,9 +291,6 @@ def _add_array_elements(key, schema):
             else:
                 sub_schema[key]["enum"] = _list_of_array_elements
         else:
-            for _, v in sub_schema.items():
-                if isinstance(v, dict):
-                    recursive_search(v, key)
+            sub_schemas.extend(v for v in sub_schema.values() if isinstance(v, dict))
 
-    recursive_search(schema, key)
     return schema
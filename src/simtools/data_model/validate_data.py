@@ -1,14 +1,12 @@
 """Validation of data using schema."""
 
 import logging
-import os
 import re
 from pathlib import Path
 
 import numpy as np
 from astropy import units as u
-from astropy.table import Column, Table, unique
-from astropy.utils.diff import report_diff_values
+from astropy.table import Column, Table
 
 import simtools.utils.general as gen
 from simtools.data_model import schema
@@ -105,10 +103,11 @@ class DataValidator:
 
     def validate_parameter_and_file_name(self):
         """Validate that file name and key 'parameter_name' in data dict are the same."""
-        if not str(Path(self.data_file_name).stem).startswith(self.data_dict.get("parameter")):
+        _file_stem = Path(self.data_file_name).stem
+        _parameter = self.data_dict.get("parameter")
+        if not _file_stem.startswith(_parameter):
             raise ValueError(
-                f"Parameter name in data dict {self.data_dict.get('parameter')} and "
-                f"file name {Path(self.data_file_name).stem} do not match."
+                f"Parameter name in data dict {_parameter} and file name {_file_stem} do not match."
             )
 
     @staticmethod
@@ -183,10 +182,11 @@ class DataValidator:
 
         Take into account different data types and allow to use json_schema for testing.
         """
-        if self._get_data_description(index).get("type", None) == "dict":
+        _entry = self._get_data_description(index)
+        if _entry.get("type", None) == "dict":
             schema.validate_dict_using_schema(
                 data=self.data_dict["value"],
-                json_schema=self._get_data_description(index).get("json_schema"),
+                json_schema=_entry.get("json_schema"),
             )
         else:
             self._check_data_type(np.array(value).dtype, index)
@@ -194,8 +194,7 @@ class DataValidator:
         if self.data_dict.get("type") not in ("string", "dict", "file"):
             self._check_for_not_a_number(value, index)
             value, unit = self._check_and_convert_units(value, unit, index)
-            for range_type in ("allowed_range", "required_range"):
-                self._check_range(index, np.nanmin(value), np.nanmax(value), range_type)
+            self._check_ranges(index, value)
         return value, unit
 
     def _get_value_and_units_as_lists(self):
@@ -212,21 +211,21 @@ class DataValidator:
         list
             unit as list
         """
-        target_unit = self.data_dict["unit"]
         value, unit = value_conversion.split_value_and_unit(self.data_dict["value"])
+        target_unit = self.data_dict["unit"]
 
-        if not isinstance(value, list | np.ndarray):
+        if not isinstance(value, (list, np.ndarray)):
             value, unit = [value], [unit]
-        if not isinstance(target_unit, list | np.ndarray):
+        if not isinstance(target_unit, (list, np.ndarray)):
             target_unit = [target_unit] * len(value)
 
-        target_unit = [None if unit == "null" else unit for unit in target_unit]
+        target_unit = [None if t == "null" else t for t in target_unit]
         conversion_factor = [
             1 if v is None else u.Unit(v).to(u.Unit(t)) for v, t in zip(unit, target_unit)
         ]
         try:
             return [
-                v * c if not isinstance(v, bool) and not isinstance(v, dict) else v
+                v if isinstance(v, (bool, dict)) else v * c
                 for v, c in zip(value, conversion_factor)
             ], target_unit
         except TypeError:
@@ -272,8 +271,7 @@ class DataValidator:
             self._check_for_not_a_number(col.data, col_name)
             self._check_data_type(col.dtype, col_name)
             self.data_table[col_name] = col.to(u.Unit(self._get_reference_unit(col_name)))
-            self._check_range(col_name, np.nanmin(col.data), np.nanmax(col.data), "allowed_range")
-            self._check_range(col_name, np.nanmin(col.data), np.nanmax(col.data), "required_range")
+            self._check_ranges(col_name, col.data)
 
     def _check_required_columns(self):
         """
@@ -288,7 +286,7 @@ class DataValidator:
         for entry in self._data_description:
             if entry.get("required", False):
                 if entry["name"] in self.data_table.columns:
-                    self._logger.debug(f"Found required data column {entry['name']}")
+                    self._logger.debug("Found required data column %s", entry["name"])
                 else:
                     raise KeyError(f"Missing required column {entry['name']}")
 
@@ -332,32 +330,38 @@ class DataValidator:
         """
         Remove duplicates from data columns as defined in the data columns description.
 
+        Duplicates are identified using the key columns only; rows with identical key
+        values are required to be identical in all columns (NaN values are considered
+        equal). The first occurrence of each row is kept and the resulting table is sorted
+        on its columns (as done by astropy.table.unique).
+
         Raises
         ------
-            if row values are different for those rows with duplications in the data columns to be
-            checked for unique values.
+        ValueError
+            if rows with identical values in the key columns differ in any other column.
 
         """
         _column_with_unique_requirement = self._get_unique_column_requirement()
         if len(_column_with_unique_requirement) == 0:
             self._logger.debug("No data columns with unique value requirement")
             return
-        _data_table_unique_for_key_column = unique(
-            self.data_table, keys=_column_with_unique_requirement
-        )
-        _data_table_unique_for_all_columns = unique(self.data_table, keys=None)
-        with open(os.devnull, "w", encoding="utf-8") as devnull:
-            if report_diff_values(
-                _data_table_unique_for_key_column,
-                _data_table_unique_for_all_columns,
-                fileobj=devnull,
-            ):
-                self.data_table = unique(self.data_table)
-            else:
-                raise ValueError(
-                    "Failed removal of duplication for column "
-                    f"{_column_with_unique_requirement}, values are not unique"
-                )
+        _keys = self.data_table[_column_with_unique_requirement].as_array()
+        _, _first_index, _inverse_index = np.unique(_keys, return_index=True, return_inverse=True)
+        if len(_first_index) < len(_keys):
+            _reference_index = _first_index[_inverse_index.ravel()]
+            for col_name in self.data_table.colnames:
+                _values = np.asarray(self.data_table[col_name])
+                _reference_values = _values[_reference_index]
+                _equal = _values == _reference_values
+                if np.issubdtype(_values.dtype, np.floating):
+                    _equal |= np.isnan(_values) & np.isnan(_reference_values)
+                if not np.all(_equal):
+                    raise ValueError(
+                        "Failed removal of duplication for column "
+                        f"{_column_with_unique_requirement}, values are not unique"
+                    )
+        self.data_table = self.data_table[_first_index]
+        self.data_table.sort(self.data_table.colnames)
 
     def _get_unique_column_requirement(self):
         """
@@ -373,7 +377,7 @@ class DataValidator:
 
         for entry in self._data_description:
             if "input_processing" in entry and "remove_duplicates" in entry["input_processing"]:
-                self._logger.debug(f"Removing duplicates for column {entry['name']}")
+                self._logger.debug("Removing duplicates for column %s", entry["name"])
                 _unique_required_column.append(entry["name"])
 
         self._logger.debug(f"Unique required columns: {_unique_required_column}")
@@ -464,9 +468,9 @@ class DataValidator:
             data = np.array(data)
 
         if np.isnan(data).any():
-            self._logger.info(f"Column {col_name} contains NaN.")
+            self._logger.info("Column %s contains NaN.", col_name)
         if np.isinf(data).any():
-            self._logger.info(f"Column {col_name} contains infinite value.")
+            self._logger.info("Column %s contains infinite value.", col_name)
 
         entry = self._get_data_description(col_name)
         if "allow_nan" in entry.get("input_processing", {}):
@@ -526,7 +530,7 @@ class DataValidator:
             If unit conversions fails
 
         """
-        self._logger.debug(f"Checking data column '{col_name}'")
+        self._logger.debug("Checking data column '%s'", col_name)
 
         reference_unit = self._get_reference_unit(col_name)
         try:
@@ -542,10 +546,10 @@ class DataValidator:
             f"'{reference_unit}' and data unit '{column_unit}'"
         )
         try:
-            if isinstance(data, u.Quantity | Column):
+            if isinstance(data, (u.Quantity, Column)):
                 return data.to(reference_unit), reference_unit
 
-            if isinstance(data, list | np.ndarray):
+            if isinstance(data, (list, np.ndarray)):
                 return self._check_and_convert_units_for_list(data, column_unit, reference_unit)
 
             # ensure that the data type is preserved (e.g., integers)
@@ -588,6 +592,28 @@ class DataValidator:
             for d, _to_unit in zip(data, column_unit)
         ], reference_unit
 
+    def _check_ranges(self, col_name, data):
+        """
+        Check that data is within allowed and required ranges (if defined in the schema).
+
+        Minimum and maximum of the data are calculated only if at least one range is defined.
+
+        Parameters
+        ----------
+        col_name: string or int
+            column name or index
+        data: value or numpy.ndarray
+            data to be tested
+
+        """
+        _entry = self._get_data_description(col_name)
+        _range_types = [r for r in ("allowed_range", "required_range") if r in _entry]
+        if len(_range_types) == 0:
+            return
+        col_min, col_max = np.nanmin(data), np.nanmax(data)
+        for range_type in _range_types:
+            self._check_range_of_entry(_entry, col_name, col_min, col_max, range_type)
+
     def _check_range(self, col_name, col_min, col_max, range_type="allowed_range"):
         """
         Check that column data is within allowed range or required range.
@@ -615,7 +641,7 @@ class DataValidator:
             range columns
 
         """
-        self._logger.debug(f"Checking data in column '{col_name}' for '{range_type}' ")
+        self._logger.debug("Checking data in column '%s' for '%s' ", col_name, range_type)
 
         if range_type not in ("allowed_range", "required_range"):
             raise KeyError("Allowed range types are 'allowed_range', 'required_range'")
@@ -623,17 +649,37 @@ class DataValidator:
         _entry = self._get_data_description(col_name)
         if range_type not in _entry:
             return
+        self._check_range_of_entry(_entry, col_name, col_min, col_max, range_type)
 
-        if not self._interval_check(
-            (col_min, col_max),
-            (_entry[range_type].get("min", -np.inf), _entry[range_type].get("max", np.inf)),
-            range_type,
-        ):
+    def _check_range_of_entry(self, _entry, col_name, col_min, col_max, range_type):
+        """
+        Check that column data is within the range defined in the given schema entry.
+
+        Parameters
+        ----------
+        _entry: dict
+            schema entry (data description) of the column
+        col_name: string or int
+            column name or index
+        col_min: float
+            minimum value of data column
+        col_max: float
+            maximum value of data column
+        range_type: string
+            column range type (either 'allowed_range' or 'required_range')
+
+        Raises
+        ------
+        ValueError
+            if columns are not in the required range
+
+        """
+        _range = _entry[range_type]
+        _range_min, _range_max = _range.get("min", -np.inf), _range.get("max", np.inf)
+        if not self._interval_check((col_min, col_max), (_range_min, _range_max), range_type):
             raise ValueError(
                 f"Value for column '{col_name}' out of range. "
-                f"([{col_min}, {col_max}], {range_type}: "
-                f"[{_entry[range_type].get('min', -np.inf)}, "
-                f"{_entry[range_type].get('max', np.inf)}])"
+                f"([{col_min}, {col_max}], {range_type}: [{_range_min}, {_range_max}])"
             )
 
     @staticmethod
@@ -660,12 +706,9 @@ class DataValidator:
 
         """
         if range_type == "allowed_range":
-            if data[0] >= axis_range[0] and data[1] <= axis_range[1]:
-                return True
+            return data[0] >= axis_range[0] and data[1] <= axis_range[1]
         if range_type == "required_range":
-            if data[0] <= axis_range[0] and data[1] >= axis_range[1]:
-                return True
-
+            return data[0] <= axis_range[0] and data[1] >= axis_range[1]
         return False
 
     def _read_validation_schema(self, schema_file):
@@ -688,7 +731,7 @@ class DataValidator:
             if 'data' can not be read from dict in schema file
         """
         try:
-            return gen.collect_data_from_file(file_name=schema_file)["data"]
+            return schema.read_schema_file(schema_file)["data"]
         except KeyError as exc:
             raise KeyError(f"Error reading validation schema from {schema_file}") from exc
 
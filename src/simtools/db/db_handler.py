@@ -601,8 +601,10 @@ class DatabaseHandler:
         """
         db = DatabaseHandler.db_client[db_name]
         file_system = gridfs.GridFS(db)
-        if file_system.exists({"filename": file_name}):
-            return file_system.find_one({"filename": file_name})
+        # single query (find_one returns None if the file does not exist)
+        file_instance = file_system.find_one({"filename": file_name})
+        if file_instance is not None:
+            return file_instance
 
         raise FileNotFoundError(f"The file {file_name} does not exist in the database {db_name}")
 
@@ -54,6 +54,8 @@ def add_model_parameters_to_db(args_dict, db):
     """
     input_path = Path(args_dict["input_path"])
     logger.info(f"Reading model parameters from repository path {input_path}")
+    file_prefix = input_path / "Files"
+    db_name = args_dict["db_name"]
     array_elements = [d for d in input_path.iterdir() if d.is_dir()]
     for element in array_elements:
         collection = names.get_collection_name_from_array_element_name(element.name, False)
@@ -67,8 +69,8 @@ def add_model_parameters_to_db(args_dict, db):
                 file=file,
                 collection=collection,
                 db=db,
-                db_name=args_dict["db_name"],
-                file_prefix=input_path / "Files",
+                db_name=db_name,
+                file_prefix=file_prefix,
             )
 
 
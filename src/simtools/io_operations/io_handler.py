@@ -3,6 +3,7 @@
 import datetime
 import logging
 from pathlib import Path
+from threading import Lock
 
 __all__ = ["IOHandler", "IOHandlerSingleton"]
 
@@ -15,16 +16,25 @@ class IOHandlerSingleton(type):
     """Singleton base class."""
 
     _instances = {}
+    _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
         """
         Ensure a single instance of the IOHandlerSingleton class.
 
         Creates a new instance if it doesn't exist, otherwise returns the existing instance.
+        Instance creation is guarded by a lock to avoid initializing the instance twice
+        when called concurrently.
         """
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return instance
 
 
 class IOHandler(metaclass=IOHandlerSingleton):
@@ -39,6 +49,8 @@ class IOHandler(metaclass=IOHandlerSingleton):
         self.use_plain_output_path = False
         self.data_path = None
         self.model_path = None
+        self._output_directory_cache = {}
+        self._default_label_dir = None
 
     def set_paths(
         self, output_path=None, data_path=None, model_path=None, use_plain_output_path=False
@@ -62,11 +74,15 @@ class IOHandler(metaclass=IOHandlerSingleton):
         self.use_plain_output_path = use_plain_output_path
         self.data_path = data_path
         self.model_path = model_path
+        self._output_directory_cache = {}
 
     def get_output_directory(self, label=None, sub_dir=None):
         """
         Return path to output directory.
 
+        Output directories are created on the first request and kept in cache (and
+        created again if removed in the meantime).
+
         Parameters
         ----------
         label: str
@@ -85,6 +101,12 @@ class IOHandler(metaclass=IOHandlerSingleton):
         TypeError
             raised for errors while creating directory name
         """
+        label_dir = label if label is not None else self._get_default_label_dir()
+        cache_key = (str(self.output_path), self.use_plain_output_path, label_dir, sub_dir)
+        cached_path = self._output_directory_cache.get(cache_key)
+        if cached_path is not None and cached_path.is_dir():
+            return cached_path
+
         path = Path(self.output_path)
         if not self.use_plain_output_path:
             path = (
@@ -92,7 +114,6 @@ class IOHandler(metaclass=IOHandlerSingleton):
                 if str(self.output_path).endswith("-output")
                 else path.joinpath("simtools-output")
             )
-            label_dir = label if label is not None else "d-" + str(datetime.date.today())
             path = (
                 path.joinpath(label_dir) if sub_dir is None else path.joinpath(label_dir, sub_dir)
             )
@@ -103,7 +124,21 @@ class IOHandler(metaclass=IOHandlerSingleton):
             self._logger.error(f"Error creating directory {path!s}")
             raise
 
-        return path.absolute()
+        self._output_directory_cache[cache_key] = path.absolute()
+        return self._output_directory_cache[cache_key]
+
+    def _get_default_label_dir(self):
+        """
+        Return default label directory name (date of first use).
+
+        Returns
+        -------
+        str
+            Default label directory name.
+        """
+        if self._default_label_dir is None:
+            self._default_label_dir = "d-" + str(datetime.date.today())
+        return self._default_label_dir
 
     def get_output_file(self, file_name, label=None, sub_dir=None):
         """
@@ -122,9 +157,7 @@ class IOHandler(metaclass=IOHandlerSingleton):
         -------
         Path
         """
-        return (
-            self.get_output_directory(label=label, sub_dir=sub_dir).joinpath(file_name).absolute()
-        )
+        return self.get_output_directory(label=label, sub_dir=sub_dir).joinpath(file_name)
 
     def get_input_data_file(self, parent_dir=None, file_name=None, test=False):
         """
@@ -76,9 +76,11 @@ class ArrayLayout:
         self.geo_coordinates = GeoCoordinates()
 
         self._telescope_list = []
+        self._auxiliary_parameters = {}
         self._corsika_observation_level = None
         self._reference_position_dict = {}
         self._array_center = None
+        self._coordinate_systems = {}
 
         self._initialize_array_layout(
             telescope_list_file=telescope_list_file,
@@ -127,6 +129,12 @@ class ArrayLayout:
         self._array_center = TelescopePosition()
         self._array_center.name = "array_center"
         self._array_center.set_coordinates("ground", 0.0 * u.m, 0.0 * u.m)
+        self._coordinate_systems = {
+            "crs_wgs84": self.geo_coordinates.crs_wgs84(),
+            "crs_utm": self.geo_coordinates.crs_utm(
+                self._reference_position_dict.get("epsg_code", None)
+            ),
+        }
         self._set_array_center_utm()
         self._array_center.set_altitude(
             u.Quantity(self._reference_position_dict.get("center_altitude", np.nan * u.m))
@@ -135,13 +143,8 @@ class ArrayLayout:
         self.name = _name if _name is not None else self.name
 
         self._logger.debug(f"Initialized array center at UTM {self._reference_position_dict}")
-        self._array_center.convert_all(
-            crs_local=self.geo_coordinates.crs_local(self._array_center),
-            crs_wgs84=self.geo_coordinates.crs_wgs84(),
-            crs_utm=self.geo_coordinates.crs_utm(
-                self._reference_position_dict.get("epsg_code", None)
-            ),
-        )
+        self._coordinate_systems["crs_local"] = self.geo_coordinates.crs_local(self._array_center)
+        self._array_center.convert_all(**self._coordinate_systems)
 
     def _set_array_center_utm(self):
         """
@@ -159,10 +162,8 @@ class ArrayLayout:
         )
         self._array_center.convert_all(
             crs_local=None,
-            crs_wgs84=self.geo_coordinates.crs_wgs84(),
-            crs_utm=self.geo_coordinates.crs_utm(
-                self._reference_position_dict.get("epsg_code", None)
-            ),
+            crs_wgs84=self._coordinate_systems["crs_wgs84"],
+            crs_utm=self._coordinate_systems["crs_utm"],
         )
 
     def _altitude_from_corsika_z(self, pos_z=None, altitude=None, telescope_axis_height=None):
@@ -188,9 +189,11 @@ class ArrayLayout:
 
         """
         self._logger.debug(
-            f"pos_z: {pos_z}, altitude: {altitude}, "
-            f"axis_height: {telescope_axis_height}, "
-            f"obs_level: {self._corsika_observation_level}"
+            "pos_z: %s, altitude: %s, axis_height: %s, obs_level: %s",
+            pos_z,
+            altitude,
+            telescope_axis_height,
+            self._corsika_observation_level,
         )
 
         if pos_z is not None and altitude is None:
@@ -229,27 +232,24 @@ class ArrayLayout:
 
         """
         tel = TelescopePosition()
-        try:
+        _colnames = row.colnames
+        if "telescope_name" in _colnames:
             tel.name = row["telescope_name"]
-            if "asset_code" not in row:
+            if "asset_code" not in _colnames:
                 try:
                     tel.asset_code = names.get_array_element_type_from_name(tel.name)
                 # asset code is not a valid telescope name; possibly a calibration device
                 except ValueError:
                     tel.asset_code = tel.name.split("-")[0]
-        except KeyError:
-            pass
-        try:
-            if tel.name is None:
-                tel.name = row["asset_code"] + "-" + row["sequence_number"]
-            tel.asset_code = row["asset_code"]
-            tel.sequence_number = row["sequence_number"]
-        except KeyError:
-            pass
-        try:
+        if "asset_code" in _colnames:
+            if "sequence_number" in _colnames:
+                if tel.name is None:
+                    tel.name = row["asset_code"] + "-" + row["sequence_number"]
+                tel.sequence_number = row["sequence_number"]
+            if tel.name is not None:
+                tel.asset_code = row["asset_code"]
+        if "geo_code" in _colnames:
             tel.geo_code = row["geo_code"]
-        except KeyError:
-            pass
         if tel.name is None:
             msg = "Missing required row with telescope_name or asset_code/sequence_number"
             self._logger.error(msg)
@@ -276,14 +276,12 @@ class ArrayLayout:
         key2: str
             Name of y-coordinate.
         """
-        try:
+        if key1 in table.colnames and key2 in table.colnames:
             tel.set_coordinates(
                 crs_name,
                 value_conversion.get_value_as_quantity(row[key1], table[key1].unit),
                 value_conversion.get_value_as_quantity(row[key2], table[key2].unit),
             )
-        except KeyError:
-            pass
 
     def _try_set_altitude(self, row, tel, table):
         """
@@ -300,7 +298,7 @@ class ArrayLayout:
         table: astropy.table.Table or astropy.table.QTable
             data table with array element coordinates.
         """
-        try:
+        if "position_z" in table.colnames:
             tel.set_altitude(
                 self._altitude_from_corsika_z(
                     pos_z=value_conversion.get_value_as_quantity(
@@ -309,14 +307,10 @@ class ArrayLayout:
                     telescope_axis_height=tel.get_axis_height(),
                 )
             )
-        except KeyError:
-            pass
-        try:
+        if "altitude" in table.colnames:
             tel.set_altitude(
                 value_conversion.get_value_as_quantity(row["altitude"], table["altitude"].unit)
             )
-        except KeyError:
-            pass
 
     def _initialize_array_layout(
         self, telescope_list_file, telescope_list_metadata_file=None, validate=False
@@ -357,13 +351,21 @@ class ArrayLayout:
                 metadata_file=telescope_list_metadata_file,
             )
 
+        _coordinate_columns = [
+            (crs_name, key1, key2)
+            for crs_name, key1, key2 in (
+                ("ground", "position_x", "position_y"),
+                ("utm", "utm_east", "utm_north"),
+                ("mercator", "latitude", "longitude"),
+            )
+            if key1 in table.colnames and key2 in table.colnames
+        ]
         for row in table:
             tel = self._load_telescope_names(row)
             if names.get_collection_name_from_array_element_name(tel.name) == "telescopes":
                 self._set_telescope_auxiliary_parameters(tel)
-            self._try_set_coordinate(row, tel, table, "ground", "position_x", "position_y")
-            self._try_set_coordinate(row, tel, table, "utm", "utm_east", "utm_north")
-            self._try_set_coordinate(row, tel, table, "mercator", "latitude", "longitude")
+            for crs_name, key1, key2 in _coordinate_columns:
+                self._try_set_coordinate(row, tel, table, crs_name, key1, key2)
             self._try_set_altitude(row, tel, table)
             self._telescope_list.append(tel)
 
@@ -423,6 +425,7 @@ class ArrayLayout:
             model_version=self.model_version,
             mongo_db_config=self.mongo_db_config,
             label=self.label,
+            db=self.site_model.db if self.site_model is not None else None,
         )
 
     def _set_telescope_auxiliary_parameters(self, telescope, telescope_name=None):
@@ -444,16 +447,39 @@ class ArrayLayout:
                 f" (model version {self.model_version})"
             )
             try:
-                tel_model = self._get_telescope_model(telescope_name)
+                _parameters = self._get_auxiliary_parameters(telescope_name)
             except ValueError:
-                tel_model = self._get_telescope_model(
+                _parameters = self._get_auxiliary_parameters(
                     names.get_array_element_type_from_name(telescope_name) + "-design",
                 )
 
-            for para in ("telescope_axis_height", "telescope_sphere_radius"):
-                telescope.set_auxiliary_parameter(
-                    para, tel_model.get_parameter_value_with_unit(para)
-                )
+            for para, value in _parameters.items():
+                telescope.set_auxiliary_parameter(para, value)
+
+    def _get_auxiliary_parameters(self, telescope_name):
+        """
+        Get auxiliary CORSIKA parameters for a telescope model.
+
+        Parameters are read once per telescope model and kept in cache (design models
+        are typically shared by many array elements).
+
+        Parameters
+        ----------
+        telescope_name: str
+            Name of the telescope (or design) model.
+
+        Returns
+        -------
+        dict
+            Telescope axis height and sphere radius.
+        """
+        if telescope_name not in self._auxiliary_parameters:
+            tel_model = self._get_telescope_model(telescope_name)
+            self._auxiliary_parameters[telescope_name] = {
+                para: tel_model.get_parameter_value_with_unit(para)
+                for para in ("telescope_axis_height", "telescope_sphere_radius")
+            }
+        return self._auxiliary_parameters[telescope_name]
 
     def add_telescope(
         self, telescope_name, crs_name, xx, yy, altitude=None, tel_corsika_z=None, design_model=None
@@ -540,11 +566,8 @@ class ArrayLayout:
             asset_code.append(tel.asset_code)
             sequence_number.append(tel.sequence_number)
             geo_code.append(tel.geo_code)
-            x, y, z = tel.get_coordinates(crs_name)
+            x, y, z = tel.get_coordinates(crs_name, coordinate_field="value")
             if crs_name == "ground":
-                z = self._altitude_from_corsika_z(
-                    altitude=z, telescope_axis_height=tel.get_axis_height()
-                )
                 pos_t.append(tel.get_axis_height())
             pos_x.append(x)
             pos_y.append(y)
@@ -564,9 +587,16 @@ class ArrayLayout:
             _name_x, _name_y, _name_z = self._telescope_list[0].get_coordinates(
                 crs_name=crs_name, coordinate_field="name"
             )
-            table[_name_x] = pos_x
-            table[_name_y] = pos_y
-            table[_name_z] = pos_z
+            _unit_x, _unit_y, _unit_z = self._telescope_list[0].get_coordinates(
+                crs_name=crs_name, coordinate_field="unit"
+            )
+            table[_name_x] = np.array(pos_x, dtype=np.float64) * _unit_x
+            table[_name_y] = np.array(pos_y, dtype=np.float64) * _unit_y
+            table[_name_z] = np.array(pos_z, dtype=np.float64) * _unit_z
+            if crs_name == "ground":
+                table[_name_z] = self._altitude_from_corsika_z(
+                    altitude=table[_name_z], telescope_axis_height=u.Quantity(pos_t)
+                ).to(_unit_z)
             if len(pos_t) > 0:
                 table["telescope_axis_height"] = pos_t
             if len(tel_r) > 0:
@@ -662,29 +692,21 @@ class ArrayLayout:
             Name of coordinate system to be used for export.
 
         """
-        for tel in self._telescope_list:
+        corsika_observation_level = (
+            self._corsika_observation_level if crs_name == "ground" else None
+        )
+        for index, tel in enumerate(self._telescope_list):
             tel.print_compact_format(
                 crs_name=crs_name,
-                print_header=(tel == self._telescope_list[0]),
-                corsika_observation_level=(
-                    self._corsika_observation_level if crs_name == "ground" else None
-                ),
+                print_header=(index == 0),
+                corsika_observation_level=corsika_observation_level,
             )
 
     def convert_coordinates(self):
         """Perform all the possible conversions the coordinates of the tel positions."""
         self._logger.info("Converting telescope coordinates")
 
-        crs_wgs84 = self.geo_coordinates.crs_wgs84()
-        crs_local = self.geo_coordinates.crs_local(self._array_center)
-        crs_utm = self.geo_coordinates.crs_utm(self._reference_position_dict.get("epsg_code", None))
-
-        for tel in self._telescope_list:
-            tel.convert_all(
-                crs_local=crs_local,
-                crs_wgs84=crs_wgs84,
-                crs_utm=crs_utm,
-            )
+        TelescopePosition.convert_all_positions(self._telescope_list, **self._coordinate_systems)
 
     def select_assets(self, asset_list=None):
         """
@@ -1,6 +1,7 @@
 """Definition of geospatial coordinate systems."""
 
 import logging
+from functools import cache
 
 import astropy.units as u
 import numpy as np
@@ -35,7 +36,7 @@ class GeoCoordinates:
 
         """
         if epsg:
-            crs_utm = pyproj.CRS.from_user_input(epsg)
+            crs_utm = _crs_from_user_input(epsg)
             self._logger.debug(f"UTM coordinate system: {crs_utm}")
             return crs_utm
 
@@ -52,7 +53,7 @@ class GeoCoordinates:
             WGS84 coordinate system.
 
         """
-        return pyproj.CRS("EPSG:4326")
+        return _crs_from_user_input("EPSG:4326")
 
     def crs_local(self, reference_point):
         """
@@ -81,7 +82,7 @@ class GeoCoordinates:
                     f" +lon_0={_center_lon} +lat_0={_center_lat}"
                     f" +axis=nwu +units=m +k_0={_scale_factor_k_0}"
                 )
-                crs_local = pyproj.CRS.from_proj4(proj4_string)
+                crs_local = _crs_from_proj4(proj4_string)
                 self._logger.debug(f"Ground (sim_telarray) coordinate system: {crs_local}")
                 return crs_local
         except AttributeError:
@@ -108,12 +109,14 @@ class GeoCoordinates:
             True if reference point has valid coordinates.
 
         """
-        _center_lat, _center_lon, _center_alt = reference_point.get_coordinates("mercator")
-        if np.isnan(_center_alt.value):
+        _center_lat, _center_lon, _center_alt = reference_point.get_coordinates(
+            "mercator", coordinate_field="value"
+        )
+        if np.isnan(_center_alt):
             self._logger.debug("Missing array center altitude")
             return False
 
-        if np.isnan(_center_lat.value) or np.isnan(_center_lon.value):
+        if np.isnan(_center_lat) or np.isnan(_center_lon):
             self._logger.debug(
                 "Invalid array center coordinates "
                 f"(lat={_center_lat}, lon={_center_lon}, alt={_center_alt})"
@@ -191,3 +194,39 @@ class GeoCoordinates:
             semi_major_axis**2 * np.cos(_lat_rad) ** 2 + semi_minor_axis**2 * np.sin(_lat_rad) ** 2
         )
         return np.sqrt(_numerator / _denominator)
+
+
+@cache
+def _crs_from_user_input(crs_input):
+    """
+    Coordinate system from EPSG code or string (cached).
+
+    Parameters
+    ----------
+    crs_input: int or str
+        EPSG code or coordinate system string.
+
+    Returns
+    -------
+    pyproj.CRS
+        Coordinate system.
+    """
+    return pyproj.CRS.from_user_input(crs_input)
+
+
+@cache
+def _crs_from_proj4(proj4_string):
+    """
+    Coordinate system from proj4 string (cached).
+
+    Parameters
+    ----------
+    proj4_string: str
+        proj4 definition of coordinate system.
+
+    Returns
+    -------
+    pyproj.CRS
+        Coordinate system.
+    """
+    return pyproj.CRS.from_proj4(proj4_string)
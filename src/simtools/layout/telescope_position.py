@@ -1,6 +1,7 @@
 """Telescope positions and coordinate transformations."""
 
 import logging
+from functools import cache
 
 import astropy.units as u
 import numpy as np
@@ -88,12 +89,13 @@ class TelescopePosition:
            if coordinate system is not defined.
         """
         try:
-            _zz = self.crs[crs_name]["zz"]["value"]
-            _zz_header = self.crs[crs_name]["zz"]["name"]
+            _crs = self.crs[crs_name]
+            _zz = _crs["zz"]["value"]
+            _zz_header = _crs["zz"]["name"]
             if crs_name == "ground" and corsika_observation_level is not None:
                 _zz = (
                     self.convert_telescope_altitude_to_corsika_system(
-                        _zz * u.Unit(self.crs[crs_name]["zz"]["unit"]),
+                        _zz * u.Unit(_crs["zz"]["unit"]),
                         corsika_observation_level,
                         self.crs["auxiliary"]["telescope_axis_height"]["value"]
                         * u.Unit(self.crs["auxiliary"]["telescope_axis_height"]["unit"]),
@@ -101,26 +103,20 @@ class TelescopePosition:
                 ).value
                 _zz_header = "position_z"
 
-            if crs_name == "mercator":
-                tel_str = (
-                    f"{self.name} {self.crs[crs_name]['xx']['value']:10.8f} "
-                    f"{self.crs[crs_name]['yy']['value']:10.8f} {_zz:10.2f}"
-                )
-            else:
-                tel_str = (
-                    f"{self.name} {self.crs[crs_name]['xx']['value']:10.2f} "
-                    f"{self.crs[crs_name]['yy']['value']:10.2f} {_zz:10.2f}"
-                )
-            header_str = (
-                f"telescope_name {self.crs[crs_name]['xx']['name']} "
-                f"{self.crs[crs_name]['yy']['name']} {_zz_header}"
+            _xy_format = "10.8f" if crs_name == "mercator" else "10.2f"
+            tel_str = (
+                f"{self.name} {_crs['xx']['value']:{_xy_format}} "
+                f"{_crs['yy']['value']:{_xy_format}} {_zz:10.2f}"
             )
-
-            if self.geo_code is not None:
-                tel_str += f"  {self.geo_code}"
-                header_str += "  geo_code"
+            _geo_code = f"  {self.geo_code}" if self.geo_code is not None else ""
+            tel_str += _geo_code
             if print_header:
-                print(header_str)
+                header_str = (
+                    f"telescope_name {_crs['xx']['name']} {_crs['yy']['name']} {_zz_header}"
+                )
+                if _geo_code:
+                    header_str += "  geo_code"
+                tel_str = f"{header_str}\n{tel_str}"
             print(tel_str)
         except KeyError as e:
             self._logger.error(f"Invalid coordinate system ({crs_name})")
@@ -270,17 +266,17 @@ class TelescopePosition:
             Projection of input data
         crs_to: pyproj.crs.crs.CRS
             Projection of output data
-        xx: scalar
-            Input x coordinate
-        yy: scalar
-            Input y coordinate
+        xx: scalar or numpy.ndarray
+            Input x coordinate(s)
+        yy: scalar or numpy.ndarray
+            Input y coordinate(s)
 
         Returns
         -------
-        scalar
-            Output x coordinate
-        scalar
-            Output y coordinate
+        scalar or numpy.ndarray
+            Output x coordinate(s)
+        scalar or numpy.ndarray
+            Output y coordinate(s)
 
         Raises
         ------
@@ -289,16 +285,17 @@ class TelescopePosition:
 
         """
         try:
-            transformer = pyproj.Transformer.from_crs(crs_from, crs_to)
+            transformer = _get_transformer(crs_from, crs_to)
         except pyproj.exceptions.CRSError:
             self._logger.error("Invalid coordinate system")
             raise
         if xx is None or yy is None:
             return np.nan, np.nan
         _to_x, _to_y = transformer.transform(xx=xx, yy=yy)
-        if np.isinf(_to_x) or np.isinf(_to_y):
-            return np.nan, np.nan
-        return _to_x, _to_y
+        _invalid = np.isinf(_to_x) | np.isinf(_to_y)
+        if np.ndim(_invalid) == 0:
+            return (np.nan, np.nan) if _invalid else (_to_x, _to_y)
+        return np.where(_invalid, np.nan, _to_x), np.where(_invalid, np.nan, _to_y)
 
     def _get_reference_system_from(self):
         """
@@ -509,26 +506,65 @@ class TelescopePosition:
             Pyproj CRS of the utm coordinate system.
 
         """
-        self._set_coordinate_system("ground", crs_local)
-        self._set_coordinate_system("utm", crs_utm)
-        self._set_coordinate_system("mercator", crs_wgs84)
+        self.convert_all_positions([self], crs_local, crs_wgs84, crs_utm)
+
+    @classmethod
+    def convert_all_positions(cls, telescopes, crs_local=None, crs_wgs84=None, crs_utm=None):
+        """
+        Perform conversions and fill coordinate variables for a list of array elements.
+
+        Array elements requiring the same conversion are transformed in a single call.
+
+        Parameters
+        ----------
+        telescopes: list of TelescopePosition
+            Array elements to be converted.
+        crs_local: pyproj.crs.crs.CRS
+            Pyproj CRS of the local coordinate system.
+        crs_wgs84: pyproj.crs.crs.CRS
+            Pyproj CRS of the mercator coordinate system.
+        crs_utm: pyproj.crs.crs.CRS
+            Pyproj CRS of the utm coordinate system.
 
-        _crs_from_name, _crs_from = self._get_reference_system_from()
-        if _crs_from is None:
-            return
+        """
+        _conversions = {}
+        for tel in telescopes:
+            tel._set_coordinate_system("ground", crs_local)
+            tel._set_coordinate_system("utm", crs_utm)
+            tel._set_coordinate_system("mercator", crs_wgs84)
 
-        for _crs_to_name, _crs_to in self.crs.items():
-            if _crs_to_name == _crs_from_name or not self.is_coordinate_system(_crs_to_name):
+            _crs_from_name, _crs_from = tel._get_reference_system_from()
+            if _crs_from is None:
                 continue
-            if not self.has_coordinates(_crs_to_name) and _crs_to["crs"] is not None:
-                _x, _y = self._convert(
-                    crs_from=_crs_from["crs"],
-                    crs_to=_crs_to["crs"],
-                    xx=_crs_from["xx"]["value"],
-                    yy=_crs_from["yy"]["value"],
-                )
-                self.set_coordinates(
-                    _crs_to_name, _x, _y, _crs_from["zz"]["value"] * _crs_from["zz"]["unit"]
+
+            for _crs_to_name, _crs_to in tel.crs.items():
+                if _crs_to_name == _crs_from_name or not tel.is_coordinate_system(_crs_to_name):
+                    continue
+                if not tel.has_coordinates(_crs_to_name) and _crs_to["crs"] is not None:
+                    _conversions.setdefault((_crs_from_name, _crs_to_name), []).append(tel)
+
+        for (_crs_from_name, _crs_to_name), _telescopes in _conversions.items():
+            _x, _y = _telescopes[0]._convert(
+                crs_from=_telescopes[0].crs[_crs_from_name]["crs"],
+                crs_to=_telescopes[0].crs[_crs_to_name]["crs"],
+                xx=np.array(
+                    [tel.crs[_crs_from_name]["xx"]["value"] for tel in _telescopes],
+                    dtype=np.float64,
+                ),
+                yy=np.array(
+                    [tel.crs[_crs_from_name]["yy"]["value"] for tel in _telescopes],
+                    dtype=np.float64,
+                ),
+            )
+            for tel, _tel_x, _tel_y in zip(_telescopes, _x, _y):
+                _zz = tel.crs[_crs_from_name]["zz"]
+                tel.set_coordinates(
+                    _crs_to_name,
+                    _tel_x,
+                    _tel_y,
+                    _zz["value"]
+                    if _zz["unit"] == tel.crs[_crs_to_name]["zz"]["unit"]
+                    else _zz["value"] * _zz["unit"],
                 )
 
     def get_axis_height(self):
@@ -613,3 +649,23 @@ class TelescopePosition:
                 "telescope_axis_height": {"value": np.nan, "unit": u.Unit("m")},
             },
         }
+
+
+@cache
+def _get_transformer(crs_from, crs_to):
+    """
+    Return transformer between two coordinate systems (cached).
+
+    Parameters
+    ----------
+    crs_from: pyproj.crs.crs.CRS
+        Projection of input data
+    crs_to: pyproj.crs.crs.CRS
+        Projection of output data
+
+    Returns
+    -------
+    pyproj.Transformer
+        Transformer from crs_from to crs_to.
+    """
+    return pyproj.Transformer.from_crs(crs_from, crs_to)
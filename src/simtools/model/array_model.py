@@ -92,6 +92,7 @@ class ArrayModel:
             mongo_db_config=self.mongo_db_config,
             model_version=self.model_version,
             label=self.label,
+            db=self.db,
         )
 
         array_elements = {}
@@ -170,6 +171,7 @@ class ArrayModel:
                     model_version=self.model_version,
                     mongo_db_config=self.mongo_db_config,
                     label=self.label,
+                    db=self.db,
                 )
         return telescope_model
 
@@ -125,6 +125,7 @@ class Mirrors:
         Read the mirror list in sim_telarray format and store the data.
 
         Allow to read mirror lists with different number of columns.
+        Format guessing is disabled and the C-based fast reader is used.
 
         Raises
         ------
@@ -148,6 +149,8 @@ class Mirrors:
                     "mirror_panel_id",
                 ],
                 units=["cm", "cm", "cm", "cm", None, "cm", None, None],
+                guess=False,
+                fast_reader=True,
             )
             self.mirror_table["mirror_panel_id"] = np.array(
                 [
@@ -168,6 +171,8 @@ class Mirrors:
                     "shape_type",
                 ],
                 units=["cm", "cm", "cm", "cm", None],
+                guess=False,
+                fast_reader=True,
             )
             self.mirror_table["mirror_panel_id"] = np.arange(len(self.mirror_table["mirror_x"]))
 
@@ -200,28 +205,14 @@ class Mirrors:
         if not np.any(mask):
             self._logger.debug(f"Mirror id{number} not in table, using first mirror instead")
             mask[0] = True
+        index = np.argmax(mask)
         try:
             return_values = (
-                u.Quantity(
-                    self.mirror_table[mask]["mirror_x"].value[0],
-                    self.mirror_table[mask]["mirror_x"].unit,
-                ),
-                u.Quantity(
-                    self.mirror_table[mask]["mirror_y"].value[0],
-                    self.mirror_table[mask]["mirror_y"].unit,
-                ),
-                u.Quantity(
-                    self.mirror_table[mask]["mirror_diameter"].value[0],
-                    self.mirror_table[mask]["mirror_diameter"].unit,
-                ),
-                u.Quantity(
-                    self.mirror_table[mask]["focal_length"].value[0],
-                    self.mirror_table[mask]["focal_length"].unit,
-                ),
-                u.Quantity(
-                    self.mirror_table[mask]["shape_type"].value[0],
-                    self.mirror_table[mask]["shape_type"].unit,
-                ),
+                self._get_mirror_table_value("mirror_x", index),
+                self._get_mirror_table_value("mirror_y", index),
+                self._get_mirror_table_value("mirror_diameter", index),
+                self._get_mirror_table_value("focal_length", index),
+                self._get_mirror_table_value("shape_type", index),
             )
         except KeyError:
             self._logger.debug("Mirror list missing required column")
@@ -229,13 +220,31 @@ class Mirrors:
                 0,
                 0,
                 self.mirror_diameter,
-                u.Quantity(
-                    self.mirror_table[mask]["focal_length"].value[0],
-                    self.mirror_table[mask]["focal_length"].unit,
-                ),
+                self._get_mirror_table_value("focal_length", index),
                 self.shape_type,
             )
         return return_values
 
+    def _get_mirror_table_value(self, column_name, index):
+        """
+        Get value (with unit) of a mirror table column for the given row index.
+
+        Avoids building a masked copy of the mirror table for each column.
+
+        Parameters
+        ----------
+        column_name: str
+            Name of the mirror table column.
+        index: int
+            Row index.
+
+        Returns
+        -------
+        astropy.units.Quantity
+            Value of the column at the given row.
+        """
+        column = self.mirror_table[column_name]
+        return u.Quantity(column.value[index], column.unit)
+
     def plot_mirror_layout(self):
         """Plot the mirror layout (not implemented yet)."""
@@ -4,6 +4,7 @@
 import logging
 import shutil
 from copy import copy
+from functools import cache
 
 import astropy.units as u
 from astropy.table import Table
@@ -182,11 +183,11 @@ class ModelParameter:
 
             # if there is only one value or the values share one unit
             if (isinstance(_value, (int | float))) or (len(_value) > len(_unit)):
-                return _value * u.Unit(_unit[0])
+                return _value * _get_unit(_unit[0])
 
             # entries with 'null' units should be returned as dimensionless
             _astropy_units = [
-                u.Unit(item) if item != "null" else u.dimensionless_unscaled for item in _unit
+                _get_unit(item) if item != "null" else u.dimensionless_unscaled for item in _unit
             ]
 
             return [_value[i] * _astropy_units[i] for i in range(len(_value))]
@@ -475,9 +476,11 @@ class ModelParameter:
 
     def export_model_files(self):
         """Export the model files into the config file directory."""
-        # Removing parameter files added manually (which are not in DB)
-        pars_from_db = copy(self._parameters)
+        # Removing parameter files added manually (which are not in DB);
+        # parameters are copied only if files were added (read-only otherwise)
+        pars_from_db = self._parameters
         if self._added_parameter_files is not None:
+            pars_from_db = copy(self._parameters)
             for par in self._added_parameter_files:
                 pars_from_db.pop(par)
 
@@ -598,3 +601,14 @@ class ModelParameter:
             },
             dest=model_directory,
         )
+
+
+@cache
+def _get_unit(unit_string):
+    """
+    Return astropy unit for a unit string.
+
+    Results are kept in cache, as parsing of composite units (e.g., 'm / s') is slow
+    and the same units are used by many model parameters.
+    """
+    return u.Unit(unit_string)
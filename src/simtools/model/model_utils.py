@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """Helper functions calculations related to model parameters."""
 
-import math
+import numpy as np
 
 from simtools.utils import names
 
@@ -10,31 +10,36 @@ __all__ = [
     "is_two_mirror_telescope",
 ]
 
+_DEG_TO_RAD = np.pi / 180.0
+_TWO_MIRROR_TELESCOPE_TYPES = frozenset({"SST", "SCT"})
 
-def compute_telescope_transmission(pars: list[float], off_axis: float) -> float:
+
+def compute_telescope_transmission(
+    pars: list[float], off_axis: float | np.ndarray
+) -> float | np.ndarray:
     """
     Compute telescope transmission (0 < T < 1) for a given off-axis angle.
 
     The telescope transmission depends on the MC model used.
+    Off-axis angles can be given as scalar or as array.
 
     Parameters
     ----------
     pars: list of float
         Parameters of the telescope transmission. Len(pars) should be 5 or 6.
-    off_axis: float
-        Off-axis angle in deg.
+    off_axis: float or numpy.ndarray
+        Off-axis angle(s) in deg.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Telescope transmission.
     """
-    _deg_to_rad = math.pi / 180.0
     if pars[1] == 0:
-        return pars[0]
+        return pars[0] if np.isscalar(off_axis) else np.full(np.shape(off_axis), pars[0])
 
-    t = math.sin(off_axis * _deg_to_rad) / (pars[3] * _deg_to_rad)
-    return pars[0] / (1.0 + pars[2] * t ** pars[4])
+    t = np.sin(np.asarray(off_axis) * _DEG_TO_RAD) / (pars[3] * _DEG_TO_RAD)
+    return pars[0] / (1.0 + pars[2] * np.power(t, pars[4]))
 
 
 def is_two_mirror_telescope(telescope_model_name: str) -> bool:
@@ -52,6 +57,4 @@ def is_two_mirror_telescope(telescope_model_name: str) -> bool:
         True if it is a two-mirror telescope.
     """
     tel_type = names.get_array_element_type_from_name(telescope_model_name)
-    if "SST" in tel_type or "SCT" in tel_type:
-        return True
-    return False
+    return tel_type[:3] in _TWO_MIRROR_TELESCOPE_TYPES
@@ -23,6 +23,8 @@ class SiteModel(ModelParameter):
         Model version.
     label: str, optional
         Instance label. Important for output file naming.
+    db: DatabaseHandler, optional
+        Database handler to be shared with other model instances.
     """
 
     def __init__(
@@ -31,6 +33,7 @@ class SiteModel(ModelParameter):
         mongo_db_config: dict,
         model_version: str,
         label: str | None = None,
+        db=None,
     ):
         """Initialize SiteModel."""
         self._logger = logging.getLogger(__name__)
@@ -39,7 +42,7 @@ class SiteModel(ModelParameter):
             site=site,
             mongo_db_config=mongo_db_config,
             model_version=model_version,
-            db=None,
+            db=db,
             label=label,
         )
 
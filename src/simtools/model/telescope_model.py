@@ -34,6 +34,8 @@ class TelescopeModel(ModelParameter):
         Model version.
     label: str, optional
         Instance label. Important for output file naming.
+    db: DatabaseHandler, optional
+        Database handler to be shared with other model instances.
     """
 
     def __init__(
@@ -43,6 +45,7 @@ class TelescopeModel(ModelParameter):
         mongo_db_config: dict,
         model_version: str,
         label: str | None = None,
+        db=None,
     ):
         """Initialize TelescopeModel."""
         super().__init__(
@@ -50,7 +53,7 @@ class TelescopeModel(ModelParameter):
             array_element_name=telescope_name,
             mongo_db_config=mongo_db_config,
             model_version=model_version,
-            db=None,
+            db=db,
             label=label,
         )
 
@@ -225,8 +228,9 @@ class TelescopeModel(ModelParameter):
             return False
 
         file = self.config_file_directory.joinpath(file_name)
-        with open(file, encoding="utf-8") as f:
-            return "@RPOL@" in f.read()
+        # marker is in the header; stop reading at its first occurrence
+        with open(file, "rb") as f:
+            return any(b"@RPOL@" in line for line in f)
 
     def read_two_dim_wavelength_angle(self, file_name: str | Path) -> dict:
         """
@@ -247,15 +251,13 @@ class TelescopeModel(ModelParameter):
         """
         _file = self.config_file_directory.joinpath(file_name)
         self._logger.debug("Reading two dimensional distribution from %s", _file)
-        line_to_start_from = 0
         with open(_file, encoding="utf-8") as f:
-            for i_line, line in enumerate(f):
+            for line in f:
                 if line.startswith("ANGLE"):
                     degrees = np.array(line.strip().split("=")[1].split(), dtype=np.float16)
-                    line_to_start_from = i_line + 1
-                    break  # The rest can be read with np.loadtxt
+                    break  # The rest is read with np.loadtxt from the same file handle
 
-        _data = np.loadtxt(_file, skiprows=line_to_start_from)
+            _data = np.loadtxt(f)
 
         return {
             "Wavelength": _data[:, 0],
@@ -319,16 +321,22 @@ class TelescopeModel(ModelParameter):
         average_curve: astropy.table.Table
             Instance of astropy.table.Table with the averaged curve.
         """
-        weights = []
-        for angle_now in curves["Angle"]:
-            weights.append(
-                incidence_angle_dist["Fraction"][
-                    np.nanargmin(np.abs(angle_now - incidence_angle_dist["Incidence angle"].value))
-                ]
-            )
+        # closest incidence angle for all curve angles at once
+        _closest_angle_index = np.nanargmin(
+            np.abs(
+                np.asarray(curves["Angle"])[:, np.newaxis]
+                - incidence_angle_dist["Incidence angle"].value[np.newaxis, :]
+            ),
+            axis=1,
+        )
+        weights = np.asarray(incidence_angle_dist["Fraction"])[_closest_angle_index]
+        _sum_of_weights = np.sum(weights)
+        if _sum_of_weights == 0:
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
 
+        # weighted average over angles as a single matrix-vector product
         return Table(
-            [curves["Wavelength"], np.average(curves["z"], weights=weights, axis=0)],
+            [curves["Wavelength"], weights @ np.asarray(curves["z"]) / _sum_of_weights],
             names=("Wavelength", "z"),
         )
 
@@ -1,6 +1,8 @@
 """Evaluate statistical uncertainties from DL2 MC event files."""
 
 import logging
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
 from astropy import units as u
@@ -48,7 +50,8 @@ class StatisticalErrorEvaluator:
         self.metric_results = None
         self.energy_threshold = None
 
-    def _load_event_data(self, hdul, data_type):
+    @staticmethod
+    def _load_event_data(hdul, data_type):
         """
         Load data and units for the event and simulated data data.
 
@@ -109,28 +112,17 @@ class StatisticalErrorEvaluator:
         dict
             Dictionary containing data from the DL2 MC event file with units.
         """
-        data = {}
         try:
-            with fits.open(file_path) as hdul:
-                events_data, event_units = self._load_event_data(hdul, "EVENTS")
-                sim_events_data, sim_units = self._load_event_data(hdul, "SIMULATED EVENTS")
-
-                data = {
-                    "event_energies_reco": events_data["ENERGY"] * event_units["ENERGY"],
-                    "event_energies_mc": events_data["MC_ENERGY"] * event_units["MC_ENERGY"],
-                    "bin_edges_low": sim_events_data["MC_ENERG_LO"] * sim_units["MC_ENERG_LO"],
-                    "bin_edges_high": sim_events_data["MC_ENERG_HI"] * sim_units["MC_ENERG_HI"],
-                    "simulated_event_histogram": sim_events_data["EVENTS"] * u.count,
-                    "viewcone": hdul[3].data["viewcone"][0][1],  # pylint: disable=E1101
-                    "core_range": hdul[3].data["core_range"][0][1],  # pylint: disable=E1101
-                }
-                self._set_grid_point(events_data)
-
+            _file_stat = Path(file_path).stat()
+            data, pointing = _read_dl2_file(
+                str(file_path), _file_stat.st_mtime_ns, _file_stat.st_size
+            )
         except FileNotFoundError as e:
             error_message = f"Error loading file {file_path}: {e}"
             self._logger.error(error_message)
             raise FileNotFoundError(error_message) from e
-        return data
+        self._set_grid_point(pointing)
+        return dict(data)
 
     def create_bin_edges(self):
         """
@@ -308,15 +300,27 @@ class StatisticalErrorEvaluator:
         bin_edges = self.create_bin_edges()
         bin_indices = np.digitize(event_energies_reco, bin_edges) - 1
 
-        energy_deviation_by_bin = [
-            energy_deviation[bin_indices == i] for i in range(len(bin_edges) - 1)
-        ]
+        # Per-bin statistics from weighted bin counts (single pass over all events per moment)
+        n_bins = len(bin_edges) - 1
+        in_range = (bin_indices >= 0) & (bin_indices < n_bins)
+        bin_indices = bin_indices[in_range]
+        energy_deviation = energy_deviation.to_value(u.dimensionless_unscaled)[in_range]
+        counts = np.bincount(bin_indices, minlength=n_bins)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_deviation = np.bincount(bin_indices, weights=energy_deviation, minlength=n_bins)
+            mean_deviation /= counts
+            variance = np.bincount(
+                bin_indices,
+                weights=(energy_deviation - mean_deviation[bin_indices]) ** 2,
+                minlength=n_bins,
+            )
+            variance /= counts
 
         # Calculate sigma for each bin
-        sigma_energy = [np.std(d) if len(d) > 0 else np.nan for d in energy_deviation_by_bin]
+        sigma_energy = np.sqrt(variance).tolist()
 
         # Calculate delta_energy as the mean deviation for each bin
-        delta_energy = [np.mean(d) if len(d) > 0 else np.nan for d in energy_deviation_by_bin]
+        delta_energy = mean_deviation.tolist()
 
         # Combine sigma into a single measure
         overall_uncertainty = np.nanmean(sigma_energy)
@@ -427,3 +431,49 @@ class StatisticalErrorEvaluator:
             raise ValueError(f"Unsupported metric: {metric}")
 
         return overall_metric
+
+
+@lru_cache(maxsize=2)
+def _read_dl2_file(
+    file_path,
+    modification_time,  # pylint: disable=unused-argument
+    file_size,  # pylint: disable=unused-argument
+):
+    """
+    Read event data and pointing directions from a DL2 MC event file.
+
+    Results for the most recently read files are kept in cache, as the same file is used
+    for several grid points (e.g., for all offsets at a given zenith angle). Modification
+    time and file size are part of the cache key (not used otherwise), so that changed files
+    are read again. Cached arrays are shared between callers and are therefore read-only.
+
+    Returns
+    -------
+    dict
+        Dictionary containing data from the DL2 MC event file with units.
+    dict
+        Unique pointing azimuth ('PNT_AZ') and altitude ('PNT_ALT') of the events.
+    """
+    with fits.open(file_path) as hdul:
+        events_data, event_units = StatisticalErrorEvaluator._load_event_data(hdul, "EVENTS")
+        sim_events_data, sim_units = StatisticalErrorEvaluator._load_event_data(
+            hdul, "SIMULATED EVENTS"
+        )
+
+        data = {
+            "event_energies_reco": events_data["ENERGY"] * event_units["ENERGY"],
+            "event_energies_mc": events_data["MC_ENERGY"] * event_units["MC_ENERGY"],
+            "bin_edges_low": sim_events_data["MC_ENERG_LO"] * sim_units["MC_ENERG_LO"],
+            "bin_edges_high": sim_events_data["MC_ENERG_HI"] * sim_units["MC_ENERG_HI"],
+            "simulated_event_histogram": sim_events_data["EVENTS"] * u.count,
+            "viewcone": hdul[3].data["viewcone"][0][1],  # pylint: disable=E1101
+            "core_range": hdul[3].data["core_range"][0][1],  # pylint: disable=E1101
+        }
+        pointing = {
+            "PNT_AZ": np.unique(events_data["PNT_AZ"]),
+            "PNT_ALT": np.unique(events_data["PNT_ALT"]),
+        }
+    for value in [*data.values(), *pointing.values()]:
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    return data, pointing
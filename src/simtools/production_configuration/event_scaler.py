@@ -58,19 +58,24 @@ class EventScaler:
         base_events = self._number_of_simulated_events()
 
         if return_sum:
-            return np.sum(base_events * scaling_factor)
+            # scale the total instead of scaling each bin before summing
+            return np.sum(base_events) * scaling_factor
         return base_events * scaling_factor
 
     def _compute_scaling_factor(self) -> float:
         """
         Compute the scaling factor based on the error metrics.
 
+        Metrics already calculated by the evaluator are reused.
+
         Returns
         -------
         float
             The scaling factor.
         """
-        metric_results = self.evaluator.calculate_metrics()
+        metric_results = self.evaluator.metric_results
+        if metric_results is None:
+            metric_results = self.evaluator.calculate_metrics()
         uncertainty_effective_area = metric_results.get("uncertainty_effective_area", {})
         current_max_error = uncertainty_effective_area.get("max_error")
         target_max_error = self.metrics.get("uncertainty_effective_area", {}).get("target_error")[
@@ -124,13 +129,9 @@ class EventScaler:
         bin_edges = self.evaluator.create_bin_edges()
         bin_idx = np.digitize(energy, bin_edges) - 1
 
-        scaling_factor = self._compute_scaling_factor()
-
         simulated_event_histogram = self.evaluator.data.get("simulated_event_histogram", [])
 
         if bin_idx < 0 or bin_idx >= len(simulated_event_histogram):
             raise ValueError(f"Energy {energy} is outside the range of the simulated events data.")
 
-        base_events = self._number_of_simulated_events()
-        base_event_at_energy = base_events[bin_idx]
-        return base_event_at_energy * scaling_factor
+        return simulated_event_histogram[bin_idx] * self._compute_scaling_factor()
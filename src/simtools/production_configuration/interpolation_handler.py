@@ -1,8 +1,10 @@
 """Interpolates between instances of StatisticalErrorEvaluator using EventScaler."""
 
+from functools import partial
+
 import astropy.units as u
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator, griddata
 
 from simtools.production_configuration.event_scaler import EventScaler
 
@@ -35,6 +37,21 @@ class InterpolationHandler:
         self.energy_thresholds = np.array([e.energy_threshold for e in self.evaluators])
 
         self.data, self.grid_points = self._build_data_array()
+        self._interpolator = None
+        self._non_flat_mask = None
+
+        # Grid of (azimuth, zenith, nsb, offset) used for energy threshold interpolation
+        threshold_grid_points = np.array(
+            [
+                np.array([az, zen, nsb, offset])
+                for az, zen, nsb, offset in zip(
+                    self.azimuths, self.zeniths, self.nsbs, self.offsets
+                )
+            ]
+        )
+        self._threshold_grid_points, self._threshold_non_flat_mask = self._remove_flat_dimensions(
+            threshold_grid_points
+        )
 
     def _build_data_array(self):
         """
@@ -97,18 +114,35 @@ class InterpolationHandler:
         np.ndarray
             Interpolated values at the query points.
         """
-        reduced_grid_points, non_flat_mask = self._remove_flat_dimensions(self.grid_points)
-        reduced_query_points = query_points[:, non_flat_mask]
-
-        # Interpolate using the reduced dimensions
-        return griddata(
-            reduced_grid_points,
-            self.data,
-            reduced_query_points,
-            method="linear",
-            fill_value=np.nan,
-            rescale=True,
-        )
+        interpolator = self._get_interpolator()
+        return interpolator(query_points[:, self._non_flat_mask])
+
+    def _get_interpolator(self):
+        """
+        Return the linear interpolator over the grid points with flat dimensions removed.
+
+        The interpolator (including the triangulation of the grid points) is built on first
+        use and reused for all following queries. One-dimensional grids are interpolated with
+        griddata, as triangulation requires at least two dimensions.
+        """
+        if self._interpolator is None:
+            reduced_grid_points, self._non_flat_mask = self._remove_flat_dimensions(
+                self.grid_points
+            )
+            if reduced_grid_points.shape[1] > 1:
+                self._interpolator = LinearNDInterpolator(
+                    reduced_grid_points, self.data, fill_value=np.nan, rescale=True
+                )
+            else:
+                self._interpolator = partial(
+                    griddata,
+                    reduced_grid_points,
+                    self.data,
+                    method="linear",
+                    fill_value=np.nan,
+                    rescale=True,
+                )
+        return self._interpolator
 
     def interpolate_energy_threshold(self, query_point: np.ndarray) -> float:
         """
@@ -124,28 +158,12 @@ class InterpolationHandler:
         float
             Interpolated energy threshold.
         """
-        flat_grid_points = []
-        flat_energy_thresholds = []
-
-        for e in self.evaluators:
-            az = e.grid_point[1].to(u.deg).value
-            zen = e.grid_point[2].to(u.deg).value
-            nsb = e.grid_point[3]
-            offset = e.grid_point[4].to(u.deg).value
-            grid_point = np.array([az, zen, nsb, offset])
-            flat_grid_points.append(grid_point)
-            flat_energy_thresholds.append(e.energy_threshold)
-
-        flat_grid_points = np.array(flat_grid_points)
-        flat_energy_thresholds = np.array(flat_energy_thresholds)
-
-        reduced_grid_points, non_flat_mask = self._remove_flat_dimensions(flat_grid_points)
-        full_non_flat_mask = np.concatenate(([False], non_flat_mask))
+        full_non_flat_mask = np.concatenate(([False], self._threshold_non_flat_mask))
         reduced_query_point = query_point[0][full_non_flat_mask]
 
         interpolated_threshold = griddata(
-            reduced_grid_points,
-            flat_energy_thresholds,
+            self._threshold_grid_points,
+            np.array([e.energy_threshold for e in self.evaluators]),
             reduced_query_point,
             method="linear",
             fill_value=np.nan,
@@ -167,7 +185,7 @@ class InterpolationHandler:
 
         midpoints = 0.5 * (evaluator.data["bin_edges_high"] + evaluator.data["bin_edges_low"])
 
-        self.grid_points = np.column_stack(
+        query_points = np.column_stack(
             [
                 midpoints,
                 np.full_like(midpoints, evaluator.grid_point[1]),
@@ -177,7 +195,7 @@ class InterpolationHandler:
             ]
         )
 
-        self.interpolate(self.grid_points)
+        self.interpolate(query_points)
 
         plt.plot(midpoints, evaluator.scaled_events, label="Scaled")
 
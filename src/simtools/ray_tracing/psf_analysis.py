@@ -319,10 +319,8 @@ class PSFImage:
         """
         self._logger.debug(f"Finding PSF for fraction = {fraction}")
 
-        x_pos_sq = [i**2 for i in self.photon_pos_x]
-        y_pos_sq = [i**2 for i in self.photon_pos_y]
-        x_pos_sig = sqrt(np.mean(x_pos_sq) - self.centroid_x**2)
-        y_pos_sig = sqrt(np.mean(y_pos_sq) - self.centroid_y**2)
+        x_pos_sig = sqrt(np.mean(np.square(self.photon_pos_x)) - self.centroid_x**2)
+        y_pos_sig = sqrt(np.mean(np.square(self.photon_pos_y)) - self.centroid_y**2)
         radius_sig = sqrt(x_pos_sig**2 + y_pos_sig**2)
 
         target_number = fraction * self._number_of_detected_photons
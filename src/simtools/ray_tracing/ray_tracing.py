@@ -322,8 +322,12 @@ class RayTracing:
             List of results for each combination of off-axis angle and mirror.
         """
         _rows = []
+        # transmission depends on the off-axis angle only (same for all mirrors)
+        tel_transmissions = compute_telescope_transmission(
+            tel_transmission_pars, self.off_axis_angle
+        )
 
-        for this_off_axis in self.off_axis_angle:
+        for this_off_axis, tel_transmission in zip(self.off_axis_angle, tel_transmissions):
             for mirror_number, mirror_data in self.mirrors.items():
                 self._logger.debug(f"Analyzing RayTracing for off_axis={this_off_axis}")
 
@@ -334,9 +338,6 @@ class RayTracing:
                     + ".gz"
                 )
 
-                tel_transmission = compute_telescope_transmission(
-                    tel_transmission_pars, this_off_axis
-                )
                 image = self._create_psf_image(
                     photons_file,
                     mirror_data["focal_length"],
@@ -3,6 +3,8 @@
 
 import logging
 import re
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
 
@@ -10,6 +12,9 @@ import simtools.utils.general as gen
 
 __all__ = ["SimtelConfigReader"]
 
+# split lines into parts (space, tabs, comma separated)
+_SIMTEL_CONFIG_SEPARATOR = re.compile(r",\s*|\s+")
+
 
 class SimtelConfigReader:
     """
@@ -156,17 +161,18 @@ class SimtelConfigReader:
             f"Reading simtel config file {simtel_config_file} "
             f"for parameter {self.parameter_name}"
         )
-        matching_lines = {}
         try:
-            with open(simtel_config_file, encoding="utf-8") as file:
-                for line in file:
-                    # split line into parts (space, tabs, comma separated)
-                    parts_of_lines = re.split(r",\s*|\s+", line.strip())
-                    if self.simtel_parameter_name == parts_of_lines[1].upper():
-                        matching_lines[parts_of_lines[0]] = parts_of_lines[2:]
+            _file_stat = Path(simtel_config_file).stat()
         except FileNotFoundError as exc:
             self._logger.error(f"File {simtel_config_file} not found.")
             raise exc
+        lines_by_parameter = _read_simtel_config_lines(
+            str(simtel_config_file), _file_stat.st_mtime_ns, _file_stat.st_size
+        )
+        matching_lines = {
+            field: list(values)
+            for field, values in lines_by_parameter.get(self.simtel_parameter_name, {}).items()
+        }
         if len(matching_lines) == 0:
             self._logger.info(f"No entries found for parameter {self.simtel_parameter_name}")
             return None
@@ -351,3 +357,32 @@ class SimtelConfigReader:
             pass
 
         return parameter_name.upper()
+
+
+@lru_cache(maxsize=16)
+def _read_simtel_config_lines(
+    simtel_config_file,
+    modification_time,  # pylint: disable=unused-argument
+    file_size,  # pylint: disable=unused-argument
+):
+    """
+    Read sim_telarray configuration file and index lines by parameter name.
+
+    Lines are split at spaces, tabs, and commas (using a precompiled pattern). Results
+    for the most recently read files are kept in cache, as the same file is read for each
+    model parameter. Modification time and file size are part of the cache key (not used
+    otherwise), so that changed files are read again.
+
+    Returns
+    -------
+    dict
+        Dictionary with upper-case parameter names as keys and dictionaries of line
+        fields (e.g., 'type', 'default', telescope name) and their values as values.
+    """
+    lines_by_parameter = {}
+    with open(simtel_config_file, encoding="utf-8") as file:
+        for line in file:
+            parts_of_line = _SIMTEL_CONFIG_SEPARATOR.split(line.strip())
+            parameter_lines = lines_by_parameter.setdefault(parts_of_line[1].upper(), {})
+            parameter_lines[parts_of_line[0]] = tuple(parts_of_line[2:])
+    return lines_by_parameter
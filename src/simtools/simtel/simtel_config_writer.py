@@ -164,17 +164,17 @@ class SimtelConfigWriter:
             self._write_header(file, "ARRAY CONFIGURATION FILE")
 
             # Be careful with the formatting - simtel is sensitive
-            file.write("#ifndef TELESCOPE\n")
-            file.write("# define TELESCOPE 0\n")
-            file.write("#endif\n\n")
+            file.write("#ifndef TELESCOPE\n# define TELESCOPE 0\n#endif\n\n")
 
             # TELESCOPE 0 - global parameters
-            file.write("#if TELESCOPE == 0\n")
-            file.write(self.TAB + "echo *****************************\n")
-            file.write(self.TAB + f"echo Site: {self._site}\n")
-            file.write(self.TAB + f"echo LayoutName: {self._layout_name}\n")
-            file.write(self.TAB + f"echo ModelVersion: {self._model_version}\n")
-            file.write(self.TAB + "echo *****************************\n\n")
+            file.write(
+                "#if TELESCOPE == 0\n"
+                f"{self.TAB}echo *****************************\n"
+                f"{self.TAB}echo Site: {self._site}\n"
+                f"{self.TAB}echo LayoutName: {self._layout_name}\n"
+                f"{self.TAB}echo ModelVersion: {self._model_version}\n"
+                f"{self.TAB}echo *****************************\n\n"
+            )
 
             # Writing site parameters
             self._write_site_parameters(
@@ -189,12 +189,15 @@ class SimtelConfigWriter:
             tel_config_file = first_telescope.get_config_file(no_export=True).name
             file.write(f"# include <{tel_config_file}>\n\n")
 
-            # Looping over telescopes
-            for count, (tel_name, tel_model) in enumerate(telescope_model.items()):
-                tel_config_file = tel_model.get_config_file(no_export=True).name
-                file.write(f"%{tel_name}\n")
-                file.write(f"#elif TELESCOPE == {count + 1}\n\n")
-                file.write(f"# include <{tel_config_file}>\n\n")
+            # Looping over telescopes (written with a single call)
+            file.write(
+                "".join(
+                    f"%{tel_name}\n"
+                    f"#elif TELESCOPE == {count + 1}\n\n"
+                    f"# include <{tel_model.get_config_file(no_export=True).name}>\n\n"
+                    for count, (tel_name, tel_model) in enumerate(telescope_model.items())
+                )
+            )
             file.write("#endif \n\n")  # configuration files need to end with \n\n
 
     def write_single_mirror_list_file(
@@ -8,6 +8,7 @@ import tempfile
 import time
 import urllib.error
 import urllib.request
+from functools import cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -55,7 +56,7 @@ def join_url_or_path(url_or_path, *args):
         Extended URL or path.
 
     """
-    if "://" in str(url_or_path):
+    if isinstance(url_or_path, str) and "://" in url_or_path:
         return "/".join([url_or_path.rstrip("/"), *args])
     return Path(url_or_path).joinpath(*args)
 
@@ -683,9 +684,11 @@ def validate_data_type(reference_dtype, value=None, dtype=None, allow_subtypes=T
     if value is not None and dtype is None:
         dtype = _get_value_dtype(value)
 
+    reference_type = _get_reference_numpy_type(reference_dtype)
+
     # Strict comparison
     if not allow_subtypes:
-        return np.issubdtype(dtype, reference_dtype)
+        return np.issubdtype(dtype, reference_type)
 
     # Allow any sub-type of integer or float for success
     if (np.issubdtype(dtype, np.str_) or np.issubdtype(dtype, "object")) and reference_dtype in (
@@ -699,16 +702,30 @@ def validate_data_type(reference_dtype, value=None, dtype=None, allow_subtypes=T
         return True
 
     if np.issubdtype(dtype, np.integer) and (
-        np.issubdtype(reference_dtype, np.integer) or np.issubdtype(reference_dtype, np.floating)
+        np.issubdtype(reference_type, np.integer) or np.issubdtype(reference_type, np.floating)
     ):
         return True
 
-    if np.issubdtype(dtype, np.floating) and np.issubdtype(reference_dtype, np.floating):
+    if np.issubdtype(dtype, np.floating) and np.issubdtype(reference_type, np.floating):
         return True
 
     return False
 
 
+@cache
+def _get_reference_numpy_type(reference_dtype):
+    """
+    Return numpy type for a reference data type name (e.g., 'double').
+
+    Avoids the conversion of type names for each data type check. Names not
+    known to numpy (e.g., 'file', 'string') are returned unchanged.
+    """
+    try:
+        return np.dtype(reference_dtype).type
+    except TypeError:
+        return reference_dtype
+
+
 def convert_list_to_string(data, comma_separated=False, shorten_list=False, collapse_list=False):
     """
     Convert arrays to string (if required).
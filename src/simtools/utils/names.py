@@ -233,10 +233,13 @@ def get_array_element_name_from_type_site_id(array_element_type, site, array_ele
     return f"{array_element_type}{_short_site}-{_val_id}"
 
 
+@cache
 def get_array_element_type_from_name(name):
     """
     Get array element type from name, e.g. "LSTN", "MSTN".
 
+    Results are kept in cache (called for each array element of a layout).
+
     Parameters
     ----------
     name: str
@@ -304,6 +304,8 @@ def test_remove_line_feed():
 
     assert " " == collector._remove_line_feed("  ")
 
+    assert collector._remove_line_feed(None) is None
+
 
 def test_copy_list_type_metadata(args_dict_site):
     top_level_dict = {
@@ -8,6 +8,7 @@ import pytest
 import yaml
 
 from simtools.constants import (
+    METADATA_JSON_SCHEMA,
     MODEL_PARAMETER_DESCRIPTION_METASCHEMA,
     MODEL_PARAMETER_METASCHEMA,
     MODEL_PARAMETER_SCHEMA_PATH,
@@ -149,6 +150,30 @@ def test_validate_schema_astropy_units(caplog):
         )
 
 
+def test_get_schema_validator():
+    sample_schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"],
+    }
+    validator = schema._get_schema_validator(sample_schema)
+    assert validator.is_valid({"name": "John"})
+    assert not validator.is_valid({"age": 30})
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        schema._get_schema_validator({"type": "not_a_type"})
+
+
+def test_get_schema_validator_for_file(mocker):
+    schema._get_schema_validator_for_file.cache_clear()
+    spy_load_schema = mocker.spy(schema, "load_schema")
+
+    validator_1 = schema._get_schema_validator_for_file("metadata.metaschema.yml", "0.1.0")
+    validator_2 = schema._get_schema_validator_for_file("metadata.metaschema.yml", "0.1.0")
+    assert validator_1 is validator_2
+    spy_load_schema.assert_called_once_with("metadata.metaschema.yml", "0.1.0")
+
+
 def test_load_schema(caplog, tmp_test_directory):
     _metadata_schema = schema.load_schema()
     assert isinstance(_metadata_schema, dict)
@@ -179,6 +204,27 @@ def test_load_schema(caplog, tmp_test_directory):
     assert "Schema version 0.3.0 does not match 0.2.0" in caplog.text
 
 
+def test_read_schema_file(mocker, tmp_test_directory):
+    schema._read_simtools_schema_file.cache_clear()
+    spy_collect = mocker.spy(schema.gen, "collect_data_from_file")
+
+    _schema_1 = schema.read_schema_file(METADATA_JSON_SCHEMA)
+    _schema_2 = schema.read_schema_file(METADATA_JSON_SCHEMA)
+    assert spy_collect.call_count == 1
+    assert _schema_1 == _schema_2
+    # cached schema is not modified by changes to the returned copy
+    _schema_1["name"] = "modified"
+    assert schema.read_schema_file(METADATA_JSON_SCHEMA)["name"] != "modified"
+
+    # files outside of the simtools schema directory are always read
+    tmp_schema_file = Path(tmp_test_directory) / "read_schema_file.schema.yml"
+    with open(tmp_schema_file, "w", encoding="utf-8") as f:
+        yaml.dump({"name": "test"}, f)
+    schema.read_schema_file(tmp_schema_file)
+    schema.read_schema_file(tmp_schema_file)
+    assert spy_collect.call_count == 3
+
+
 def test_add_array_elements():
 
     test_dict_1 = {"data": {"InstrumentTypeElement": {"enum": ["LSTN", "MSTN"]}}}
@@ -187,3 +233,18 @@ def test_add_array_elements():
     test_dict_2 = {"data": {"InstrumentTypeElement": {"not_the_right_enum": ["LSTN", "MSTN"]}}}
     test_dict_added_2 = schema._add_array_elements("InstrumentTypeElement", test_dict_2)
     assert len(test_dict_added_2["data"]["InstrumentTypeElement"]["enum"]) > 2
+
+
+def test_add_array_elements_nested():
+    test_dict = {
+        "definitions": {
+            "a": {"InstrumentTypeElement": {"enum": ["LSTN"]}},
+            "b": {"c": {"d": {"InstrumentTypeElement": {}}}, "e": "not_a_dict"},
+        }
+    }
+    test_dict_added = schema._add_array_elements("InstrumentTypeElement", test_dict)
+    _enum_a = test_dict_added["definitions"]["a"]["InstrumentTypeElement"]["enum"]
+    _enum_d = test_dict_added["definitions"]["b"]["c"]["d"]["InstrumentTypeElement"]["enum"]
+    assert len(_enum_a) > 1
+    assert "LSTN" in _enum_a
+    assert sorted(_enum_a) == _enum_d
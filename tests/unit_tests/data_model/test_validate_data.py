@@ -281,6 +281,61 @@ def test_check_data_for_duplicates(reference_columns):
         data_validator._check_data_for_duplicates()
 
 
+def test_check_data_for_duplicates_sorted(reference_columns):
+    data_validator = validate_data.DataValidator()
+    data_validator._data_description = reference_columns
+
+    # no duplicates: table is sorted on its columns
+    table_no_duplicates = Table()
+    table_no_duplicates["wavelength"] = Column([350.0, 300.0], unit="nm", dtype="float32")
+    table_no_duplicates["qe"] = Column([0.5, 0.1], dtype="float32")
+    data_validator.data_table = table_no_duplicates
+    data_validator._check_data_for_duplicates()
+    assert list(data_validator.data_table["wavelength"]) == [300.0, 350.0]
+
+    # exact duplicates: one row per key is kept, table is sorted on its columns
+    table_duplicates = Table()
+    table_duplicates["wavelength"] = Column(
+        [400.0, 300.0, 400.0, 350.0, 300.0], unit="nm", dtype="float32"
+    )
+    table_duplicates["qe"] = Column([0.4, 0.1, 0.4, 0.5, 0.1], dtype="float32")
+    data_validator.data_table = table_duplicates
+    data_validator._check_data_for_duplicates()
+    assert list(data_validator.data_table["wavelength"]) == [300.0, 350.0, 400.0]
+    assert list(data_validator.data_table["qe"]) == pytest.approx([0.1, 0.5, 0.4])
+    assert data_validator.data_table["wavelength"].unit == u.nm
+
+    # identical key but different values in other columns
+    table_conflict = Table()
+    table_conflict["wavelength"] = Column([300.0, 350.0, 300.0], unit="nm", dtype="float32")
+    table_conflict["qe"] = Column([0.1, 0.5, 0.2], dtype="float32")
+    data_validator.data_table = table_conflict
+    with pytest.raises(ValueError, match=r"^Failed removal of duplication for column"):
+        data_validator._check_data_for_duplicates()
+
+
+def test_check_data_for_duplicates_nan(reference_columns):
+    data_validator = validate_data.DataValidator()
+    data_validator._data_description = reference_columns
+
+    # duplicated rows with NaN in a non-key column are identical
+    table_nan = Table()
+    table_nan["wavelength"] = Column([350.0, 300.0, 350.0], unit="nm", dtype="float32")
+    table_nan["qe"] = Column([np.nan, 0.1, np.nan], dtype="float32")
+    data_validator.data_table = table_nan
+    data_validator._check_data_for_duplicates()
+    assert list(data_validator.data_table["wavelength"]) == [300.0, 350.0]
+    assert np.isnan(data_validator.data_table["qe"][1])
+
+    # NaN and a number for the same key are different
+    table_nan_conflict = Table()
+    table_nan_conflict["wavelength"] = Column([350.0, 300.0, 350.0], unit="nm", dtype="float32")
+    table_nan_conflict["qe"] = Column([np.nan, 0.1, 0.5], dtype="float32")
+    data_validator.data_table = table_nan_conflict
+    with pytest.raises(ValueError, match=r"^Failed removal of duplication for column"):
+        data_validator._check_data_for_duplicates()
+
+
 def test_interval_check_allow_range():
     data_validator = validate_data.DataValidator()
 
@@ -330,6 +385,27 @@ def test_check_range(reference_columns, caplog):
         data_validator._check_range(col_3.name, col_3.min(), col_3.max(), "invalid_range")
 
 
+def test_check_ranges(reference_columns, mocker):
+    data_validator = validate_data.DataValidator()
+    data_validator._data_description = reference_columns
+    spy_description = mocker.spy(data_validator, "_get_data_description")
+    mock_check_range = mocker.patch.object(data_validator, "_check_range_of_entry")
+
+    data_validator._check_ranges("qe", np.array([0.1, np.nan, 0.5]))
+    spy_description.assert_called_once_with("qe")
+    mock_check_range.assert_called_once_with(reference_columns[1], "qe", 0.1, 0.5, "allowed_range")
+
+    mock_check_range.reset_mock()
+    data_validator._data_description = [{"name": "no_range", "type": "double"}]
+    data_validator._check_ranges("no_range", np.array([0.1, 0.5]))
+    mock_check_range.assert_not_called()
+
+    mocker.stopall()
+    data_validator._data_description = reference_columns
+    with pytest.raises(ValueError, match=r"^Value for column 'qe' out of range"):
+        data_validator._check_ranges("qe", np.array([0.1, 1.5]))
+
+
 def test_is_dimensionless():
 
     data_validator = validate_data.DataValidator()
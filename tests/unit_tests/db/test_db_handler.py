@@ -737,18 +737,17 @@ def test_get_file_mongo_db_file(db, mocker, test_db, test_file, mock_gridfs):
         db_handler.DatabaseHandler, "db_client", {test_db: mocker.Mock()}
     )
     mock_file_system = mock_gridfs.return_value
-    mock_file_system.exists.return_value = True
     mock_file_instance = mocker.Mock()
     mock_file_system.find_one.return_value = mock_file_instance
 
     result = db._get_file_mongo_db(test_db, test_file)
 
     mock_gridfs.assert_called_once_with(mock_db_client[test_db])
-    mock_file_system.exists.assert_called_once_with({"filename": test_file})
+    mock_file_system.exists.assert_not_called()
     mock_file_system.find_one.assert_called_once_with({"filename": test_file})
     assert result == mock_file_instance
 
-    mock_file_system.exists.return_value = False
+    mock_file_system.find_one.return_value = None
     with pytest.raises(
         FileNotFoundError, match=f"The file {test_file} does not exist in the database {test_db}"
     ):
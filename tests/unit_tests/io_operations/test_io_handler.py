@@ -15,6 +15,11 @@ logger = logging.getLogger()
 test_file = "test-file.txt"
 
 
+def test_io_handler_singleton(io_handler):
+    assert io_handler_module.IOHandler() is io_handler
+    assert io_handler_module.IOHandler() is io_handler_module.IOHandler()
+
+
 def test_get_output_directory(args_dict, io_handler, caplog):
     # default adding label
     assert io_handler.get_output_directory(label="test-io-handler") == Path(
@@ -33,14 +38,36 @@ def test_get_output_directory(args_dict, io_handler, caplog):
         f"{args_dict['output_path']}/unittest-output/test-io-handler/model"
     )
 
-    # FileNotFoundError
+    # FileNotFoundError (directory not yet created and cached)
     with patch.object(Path, "mkdir", side_effect=FileNotFoundError):
         with caplog.at_level("ERROR"):
             with pytest.raises(FileNotFoundError):
-                io_handler.get_output_directory(label="test-io-handler", sub_dir="model")
+                io_handler.get_output_directory(label="test-io-handler", sub_dir="not-created")
         assert "Error creating directory" in caplog.text
 
 
+def test_get_output_directory_cache(io_handler):
+    path_1 = io_handler.get_output_directory(label="test-io-handler-cache", sub_dir="model")
+    with patch.object(Path, "mkdir") as mock_mkdir:
+        path_2 = io_handler.get_output_directory(label="test-io-handler-cache", sub_dir="model")
+        assert path_1 == path_2
+        mock_mkdir.assert_not_called()
+
+        io_handler.get_output_directory(label="test-io-handler-cache", sub_dir="other")
+        mock_mkdir.assert_called_once()
+
+    # cached directory removed in the meantime is created again
+    path_1.rmdir()
+    assert io_handler.get_output_directory(label="test-io-handler-cache", sub_dir="model") == path_1
+    assert path_1.is_dir()
+
+    # cache is reset when setting paths
+    io_handler.set_paths(output_path=io_handler.output_path, data_path=io_handler.data_path)
+    with patch.object(Path, "mkdir") as mock_mkdir:
+        io_handler.get_output_directory(label="test-io-handler-cache", sub_dir="model")
+        mock_mkdir.assert_called_once()
+
+
 def test_get_output_directory_plain_output_path(args_dict, io_handler):
     # all following tests: plain_path tests
     io_handler.use_plain_output_path = True
@@ -57,6 +84,7 @@ def test_get_output_directory_plain_output_path(args_dict, io_handler):
 
 
 def test_get_output_file(args_dict, io_handler):
+    assert io_handler.get_output_file(file_name=test_file, label="test-io-handler").is_absolute()
     assert io_handler.get_output_file(file_name=test_file, label="test-io-handler") == Path(
         f"{args_dict['output_path']}/output/simtools-output/test-io-handler/{test_file}"
     )
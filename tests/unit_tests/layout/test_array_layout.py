@@ -113,6 +113,7 @@ def test_initialize_coordinate_systems(
         )
 
         assert instance.name == "test_layout"
+        assert sorted(instance._coordinate_systems) == ["crs_local", "crs_utm", "crs_wgs84"]
 
     test_one_site(
         north_layout_center_data_dict, array_layout_north_instance, 217611.227, 3185066.278
@@ -386,6 +387,17 @@ def test_try_set_coordinate(
     )
 
 
+def test_get_auxiliary_parameters(array_layout_north_instance, mocker):
+    layout = array_layout_north_instance
+    layout._auxiliary_parameters = {}
+    spy = mocker.spy(layout, "_get_telescope_model")
+
+    _parameters = layout._get_auxiliary_parameters("LSTN-design")
+    assert set(_parameters) == {"telescope_axis_height", "telescope_sphere_radius"}
+    assert layout._get_auxiliary_parameters("LSTN-design") is _parameters
+    spy.assert_called_once_with("LSTN-design")
+
+
 def test_len(telescope_north_test_file, db_config, model_version):
     layout = ArrayLayout(
         telescope_list_file=telescope_north_test_file,
@@ -19,12 +19,15 @@ def test_crs_utm():
     utm_none = geo.crs_utm(None)
     assert utm_none is None
 
+    assert geo.crs_utm(32719) is utm_crs
+
 
 def test_crs_wgs84():
     geo = GeoCoordinates()
     wgs84_crs = geo.crs_wgs84()
     assert isinstance(wgs84_crs, pyproj.CRS)
     assert wgs84_crs.to_epsg() == 4326
+    assert GeoCoordinates().crs_wgs84() is wgs84_crs
 
 
 def test_crs_local():
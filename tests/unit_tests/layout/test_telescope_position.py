@@ -11,6 +11,7 @@ import pytest
 from simtools.layout.telescope_position import (
     InvalidCoordSystemErrorError,
     TelescopePosition,
+    _get_transformer,
 )
 
 logger = logging.getLogger()
@@ -187,6 +188,25 @@ def test_convert(crs_wgs84, crs_local, crs_utm):
     assert np.isnan(_x)
     assert np.isnan(_y)
 
+    # arrays
+    _x, _y = tel._convert(
+        crs_wgs84,
+        crs_local,
+        np.array([+95.0, test_position["center_lat"].value]),
+        np.array([test_position["center_lon"].value] * 2),
+    )
+    assert np.isnan(_x[0])
+    assert np.isnan(_y[0])
+    assert math.isclose(_x[1], test_position["pos_x"].value, abs_tol=0.000001)
+    assert math.isclose(_y[1], test_position["pos_y"].value, abs_tol=0.000001)
+
+
+def test_get_transformer(crs_wgs84, crs_utm):
+    transformer = _get_transformer(crs_utm, crs_wgs84)
+    assert isinstance(transformer, pyproj.Transformer)
+    assert _get_transformer(crs_utm, crs_wgs84) is transformer
+    assert _get_transformer(crs_wgs84, crs_utm) is not transformer
+
 
 def test_get_reference_system_from(crs_utm):
     tel = TelescopePosition(name="LSTS-01")
@@ -312,6 +332,34 @@ def test_convert_all(crs_wgs84, crs_local, crs_utm):
     assert np.isnan(tel_nan.crs["utm"]["yy"]["value"])
 
 
+def test_convert_all_positions(crs_wgs84, crs_local, crs_utm):
+    tel_1 = TelescopePosition(name="LSTN-01")
+    tel_1.set_coordinates("ground", 0.0, 0.0, 2158.0 * u.m)
+    tel_2 = TelescopePosition(name="LSTN-02")
+    tel_2.set_coordinates("ground", 50.0, -25.0, 2158.0 * u.m)
+    tel_3 = TelescopePosition(name="LSTN-03")
+    tel_3.set_coordinates("utm", 217609.2270142641, 3185067.2783240844, 2160.0 * u.m)
+    tel_4 = TelescopePosition(name="LSTN-04")
+
+    TelescopePosition.convert_all_positions(
+        [tel_1, tel_2, tel_3, tel_4], crs_local=crs_local, crs_wgs84=crs_wgs84, crs_utm=crs_utm
+    )
+
+    for tel in (tel_1, tel_2):
+        tel_single = TelescopePosition(name=tel.name)
+        tel_single.set_coordinates(
+            "ground", tel.crs["ground"]["xx"]["value"], tel.crs["ground"]["yy"]["value"], 2158.0
+        )
+        tel_single.convert_all(crs_wgs84=crs_wgs84, crs_local=crs_local, crs_utm=crs_utm)
+        for crs_name in ("mercator", "utm"):
+            assert tel.get_coordinates(crs_name) == tel_single.get_coordinates(crs_name)
+
+    assert 0.0 == pytest.approx(tel_3.crs["ground"]["xx"]["value"], abs=1.0e-6)
+    assert 0.0 == pytest.approx(tel_3.crs["ground"]["yy"]["value"], abs=1.0e-6)
+    assert 2160.0 == pytest.approx(tel_3.crs["mercator"]["zz"]["value"], 1.0e-9)
+    assert not tel_4.has_coordinates("mercator")
+
+
 def test_get_altitude():
     telescope = TelescopePosition(name="LSTS-01")
     assert np.isnan(telescope.get_altitude())
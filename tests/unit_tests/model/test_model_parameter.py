@@ -9,6 +9,7 @@ from astropy import units as u
 
 import simtools.utils.general as gen
 from simtools.db.db_handler import DatabaseHandler
+from simtools.model import model_parameter
 from simtools.model.model_parameter import InvalidModelParameterError
 from simtools.model.telescope_model import TelescopeModel
 
@@ -392,3 +393,10 @@ def test_get_model_file_as_ecsv_table(telescope_model_sst, mocker):
     assert mock_db_export.call_count == 1
     assert mock_simtel_table_reader.call_count == 0
     assert mock_astropy_table_reader.call_count == 1
+
+
+def test_get_unit():
+    assert model_parameter._get_unit("m / s") == u.m / u.s
+    assert model_parameter._get_unit("m / s") is model_parameter._get_unit("m / s")
+    with pytest.raises(ValueError, match="not a valid unit"):
+        model_parameter._get_unit("not a valid unit")
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import numpy as np
 import pytest
 
 from simtools.model import model_utils
@@ -27,3 +28,13 @@ def test_compute_telescope_transmission():
     pars = [0.898, 1, 0.016, 4.136, 1.705, 0.0]
     off_axis = 2.0
     assert pytest.approx(model_utils.compute_telescope_transmission(pars, off_axis)) == 0.8938578
+
+    off_axis = np.array([0.0, 2.0])
+    assert model_utils.compute_telescope_transmission(pars, off_axis) == pytest.approx(
+        [pars[0], 0.8938578]
+    )
+
+    pars = [0.8, 0, 0.0, 0.0, 0.0]
+    assert model_utils.compute_telescope_transmission(pars, off_axis) == pytest.approx(
+        [pars[0], pars[0]]
+    )
@@ -8,6 +8,7 @@ import pytest
 import simtools.utils.general as gen
 from simtools.production_configuration.calculate_statistical_errors_grid_point import (
     StatisticalErrorEvaluator,
+    _read_dl2_file,
 )
 from simtools.production_configuration.event_scaler import EventScaler
 from simtools.production_configuration.interpolation_handler import InterpolationHandler
@@ -66,6 +67,27 @@ def test_calculate_energy_estimate(test_fits_file, metric):
     assert isinstance(delta, list)
 
 
+def test_read_dl2_file_cached(test_fits_file, metric):
+    """Test that the DL2 MC event file is read once for several evaluators."""
+    _read_dl2_file.cache_clear()
+    evaluator_1 = StatisticalErrorEvaluator(
+        file_path=test_fits_file, file_type="point-like", metrics=metric
+    )
+    evaluator_2 = StatisticalErrorEvaluator(
+        file_path=test_fits_file, file_type="point-like", metrics=metric
+    )
+    assert _read_dl2_file.cache_info().misses == 1
+    assert _read_dl2_file.cache_info().hits == 1
+    assert evaluator_1.data is not evaluator_2.data
+    assert evaluator_1.data["viewcone"] == evaluator_2.data["viewcone"]
+    assert evaluator_1.grid_point == evaluator_2.grid_point
+
+    # cached arrays are shared between evaluators and must not be modified in place
+    assert not evaluator_1.data["event_energies_reco"].flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        evaluator_1.data["event_energies_reco"][0] = 0.0 * u.TeV
+
+
 def test_missing_file():
     """Test initialization with a missing file."""
     file_path = "nonexistent_file.fits"
@@ -96,10 +118,21 @@ def test_interpolation_handler(test_fits_file, test_fits_file_2, metric):
     interpolated_values = handler.interpolate(query_point)
     assert interpolated_values.shape[0] == query_point.shape[0]
 
+    # interpolator is built once and reused for later queries
+    interpolator = handler._interpolator
+    assert handler.interpolate(query_point) == pytest.approx(interpolated_values, nan_ok=True)
+    assert handler._interpolator is interpolator
+
     query_point = np.array([[1e-3, 180, 40, 0, 0.5]])
     interpolated_threshold = handler.interpolate_energy_threshold(query_point)
     assert isinstance(interpolated_threshold, float)
 
+    # energy thresholds calculated after creating the handler are used
+    evaluator1.energy_threshold = 1.0
+    evaluator2.energy_threshold = 2.0
+    query_point = np.array([[1e-3, 0, 25, 0, 0.5]])
+    assert handler.interpolate_energy_threshold(query_point) == pytest.approx(1.25)
+
 
 def test_calculate_scaled_events(test_fits_file, metric):
     """Test the calculation of scaled events for a specific grid point using EventScaler."""
@@ -117,6 +150,11 @@ def test_calculate_scaled_events(test_fits_file, metric):
     assert scaled_events.value == pytest.approx(41249903535849.58, rel=1e-0)
     assert scaled_events.unit == u.ct
 
+    # metrics calculated for the first scaling are reused
+    with patch.object(evaluator, "calculate_metrics") as mock_calculate_metrics:
+        assert event_scaler.scale_events() == scaled_events
+        mock_calculate_metrics.assert_not_called()
+
 
 def test_calculate_metrics(test_fits_file, metric):
     """Test the calculation of metrics."""
@@ -290,3 +328,22 @@ def test_set_grid_point_single_azimuth_zenith(caplog):
             evaluator._set_grid_point(events_data)
             assert "Grid point already set to" in caplog.text
         assert evaluator.grid_point == (1 * u.TeV, 90 * u.deg, 60 * u.deg, 0, 0 * u.deg)
+
+
+def test_calculate_scaled_events_at_grid_point(test_fits_file, metric):
+    evaluator = StatisticalErrorEvaluator(
+        file_path=test_fits_file, file_type="point-like", metrics=metric
+    )
+    event_scaler = EventScaler(evaluator, science_case="science case 1", metrics=metric)
+    bin_edges = evaluator.create_bin_edges()
+    energy = 0.5 * (bin_edges[0] + bin_edges[1])
+
+    scaled_events = event_scaler.calculate_scaled_events_at_grid_point((energy, 180, 45, 0, 0.5))
+    scaled_events_per_bin = event_scaler.scale_events(return_sum=False)
+    assert scaled_events.value == pytest.approx(scaled_events_per_bin[0].value, rel=1e-12)
+    assert event_scaler.scale_events().value == pytest.approx(
+        np.sum(scaled_events_per_bin).value, rel=1e-12
+    )
+
+    with pytest.raises(ValueError, match="is outside the range of the simulated events data"):
+        event_scaler.calculate_scaled_events_at_grid_point((2 * bin_edges[-1], 180, 45, 0, 0.5))
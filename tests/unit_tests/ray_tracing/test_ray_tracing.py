@@ -246,6 +246,8 @@ def test_process_off_axis_and_mirror(ray_tracing_lst, mocker):
     mock_generate_file_name.assert_called()
     mock_create_psf_image.assert_called()
     mock_analyze_image.assert_called()
+    for _call in mock_analyze_image.call_args_list:
+        assert _call.args[3] == pytest.approx(1.0)
 
 
 def test_process_off_axis_and_mirror_no_analyze(ray_tracing_lst, mocker):
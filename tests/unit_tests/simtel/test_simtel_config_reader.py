@@ -2,11 +2,12 @@
 
 import copy
 import logging
+from pathlib import Path
 
 import numpy as np
 import pytest
 
-from simtools.simtel.simtel_config_reader import SimtelConfigReader
+from simtools.simtel.simtel_config_reader import SimtelConfigReader, _read_simtel_config_lines
 
 logger = logging.getLogger()
 
@@ -226,3 +227,24 @@ def test_get_simtel_parameter_name(config_reader_num_gains):
     # test pass on TypeError
     _config.schema_dict = None
     assert _config._get_simtel_parameter_name("num_gains") == "NUM_GAINS"
+
+
+def test_read_simtel_config_lines(simtel_config_file, tmp_test_directory):
+    _stat = Path(simtel_config_file).stat()
+    _lines = _read_simtel_config_lines(str(simtel_config_file), _stat.st_mtime_ns, _stat.st_size)
+    assert _lines["NUM_GAINS"]["limits"] == ("1", "2")
+    assert _lines["NUM_GAINS"]["type"] == ("Int", "1", "Hlu")
+    assert _lines is _read_simtel_config_lines(
+        str(simtel_config_file), _stat.st_mtime_ns, _stat.st_size
+    )
+
+    # changed files are read again
+    _tmp_file = Path(tmp_test_directory) / "simtel_config_lines.cfg"
+    _tmp_file.write_text("type\tNUM_GAINS\tInt\t1\tHlu\n", encoding="utf-8")
+    _stat = _tmp_file.stat()
+    _lines = _read_simtel_config_lines(str(_tmp_file), _stat.st_mtime_ns, _stat.st_size)
+    assert "limits" not in _lines["NUM_GAINS"]
+    _tmp_file.write_text("limits\tNUM_GAINS\t1\t2\ndefault\tNUM_GAINS\t2\n", encoding="utf-8")
+    _stat = _tmp_file.stat()
+    _lines = _read_simtel_config_lines(str(_tmp_file), _stat.st_mtime_ns, _stat.st_size)
+    assert "limits" in _lines["NUM_GAINS"]
@@ -408,6 +408,9 @@ def test_join_url_or_path():
     assert gen.join_url_or_path(url_desy, "test") == "https://www.desy.de/test"
     assert gen.join_url_or_path(url_desy, "test", "test") == "https://www.desy.de/test/test"
     assert gen.join_url_or_path("/Volume/fs01", "CTA") == Path("/Volume/fs01").joinpath("CTA")
+    assert gen.join_url_or_path(Path("/Volume/fs01"), "CTA", "test") == Path(
+        "/Volume/fs01/CTA/test"
+    )
 
 
 def test_change_dict_keys_case(caplog) -> None:
@@ -568,6 +571,13 @@ def test_validate_data_type():
         gen.validate_data_type("int", None, None, False)
 
 
+def test_get_reference_numpy_type():
+    assert gen._get_reference_numpy_type("double") is np.float64
+    assert gen._get_reference_numpy_type("int64") is np.int64
+    assert gen._get_reference_numpy_type("file") == "file"
+    assert gen._get_reference_numpy_type("boolean") == "boolean"
+
+
 def test_convert_list_to_string():
 
     assert gen.convert_list_to_string(None) is None